@@ -0,0 +1,73 @@
+"""Initial schema (as created by the original create_all)
+
+Revision ID: 0001
+Revises:
+Create Date: 2024-06-01 00:00:00
+
+Databases that were created by the application's startup create_all already
+have this table; the upgrade is then a no-op, so existing installs can run
+`alembic upgrade head` directly.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# Original per-distro version columns and their enum values
+LEGACY_VERSION_COLUMNS = {
+    "ubuntu_version": ("ubuntuversion", ["20.04", "22.04", "24.04"]),
+    "debian_version": ("debianversion", ["10", "11", "12"]),
+    "fedora_version": ("fedoraversion", ["38", "39", "40"]),
+    "centos_version": ("centosversion", ["7", "8", "9"]),
+    "rhel_version": ("rhelversion", ["8", "9"]),
+    "oracle_version": ("oracleversion", ["8", "9"]),
+    "rocky_version": ("rockyversion", ["8", "9"]),
+    "alma_version": ("almaversion", ["8", "9"]),
+}
+
+STATUSES = [
+    "pending", "pulling_image", "running", "downloading_kernel",
+    "generating_symbol", "completed", "failed",
+]
+DISTROS = ["ubuntu", "debian", "fedora", "centos", "rhel", "oracle", "rocky", "alma"]
+
+
+def upgrade():
+    if sa.inspect(op.get_bind()).has_table("symbol_generations"):
+        return
+
+    op.create_table(
+        "symbol_generations",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("kernel_version", sa.String(), nullable=False),
+        sa.Column("distro", sa.Enum(*DISTROS, name="linuxdistro"), nullable=True),
+        *[
+            sa.Column(column, sa.Enum(*values, name=type_name), nullable=True)
+            for column, (type_name, values) in LEGACY_VERSION_COLUMNS.items()
+        ],
+        sa.Column("status", sa.Enum(*STATUSES, name="symgenstatus"), nullable=True),
+        sa.Column("status_message", sa.String(), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("container_id", sa.String(), nullable=True),
+        sa.Column("symbol_filename", sa.String(), nullable=True),
+        sa.Column("symbol_file_path", sa.String(), nullable=True),
+        sa.Column("symbol_file_size", sa.BigInteger(), nullable=True),
+        sa.Column("download_count", sa.Integer(), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    )
+    op.create_index("ix_symbol_generations_id", "symbol_generations", ["id"])
+
+
+def downgrade():
+    op.drop_index("ix_symbol_generations_id", table_name="symbol_generations")
+    op.drop_table("symbol_generations")
+    bind = op.get_bind()
+    for type_name in ["symgenstatus", "linuxdistro"] + [t for t, _ in LEGACY_VERSION_COLUMNS.values()]:
+        sa.Enum(name=type_name).drop(bind, checkfirst=True)
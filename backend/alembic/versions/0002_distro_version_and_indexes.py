@@ -0,0 +1,108 @@
+"""Merge per-distro version columns into distro_version; add query indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2024-06-02 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+# Per-distro version columns, their enum types and values (as defined by 0001)
+LEGACY_VERSION_COLUMNS = {
+    "ubuntu": ("ubuntu_version", "ubuntuversion", ["20.04", "22.04", "24.04"]),
+    "debian": ("debian_version", "debianversion", ["10", "11", "12"]),
+    "fedora": ("fedora_version", "fedoraversion", ["38", "39", "40"]),
+    "centos": ("centos_version", "centosversion", ["7", "8", "9"]),
+    "rhel": ("rhel_version", "rhelversion", ["8", "9"]),
+    "oracle": ("oracle_version", "oracleversion", ["8", "9"]),
+    "rocky": ("rocky_version", "rockyversion", ["8", "9"]),
+    "alma": ("alma_version", "almaversion", ["8", "9"]),
+}
+
+INDEXES = {
+    "ix_symgen_lookup": ["kernel_version", "distro", "distro_version", "status"],
+    "ix_distro_ver": ["distro", "distro_version"],
+    "ix_symgen_status_created": ["status", "created_at"],
+}
+COMPLETED_TIMES_INDEX = "ix_symgen_completed_times"
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    columns = {c["name"] for c in inspector.get_columns("symbol_generations")}
+    indexes = {i["name"] for i in inspector.get_indexes("symbol_generations")}
+
+    if "distro_version" not in columns:
+        op.add_column("symbol_generations", sa.Column("distro_version", sa.String(), nullable=True))
+
+    legacy = {d: (col, t) for d, (col, t, _) in LEGACY_VERSION_COLUMNS.items() if col in columns}
+    if legacy:
+        cases = " ".join(
+            f"WHEN '{distro}' THEN CAST({column} AS VARCHAR)"
+            for distro, (column, _) in legacy.items()
+        )
+        op.execute(
+            "UPDATE symbol_generations SET distro_version = "
+            f"CASE CAST(distro AS VARCHAR) {cases} END "
+            "WHERE distro_version IS NULL"
+        )
+
+    # An interim ix_symgen_lookup covered the legacy version columns
+    if "ix_symgen_lookup" in indexes:
+        op.drop_index("ix_symgen_lookup", table_name="symbol_generations")
+        indexes.discard("ix_symgen_lookup")
+
+    if legacy:
+        with op.batch_alter_table("symbol_generations") as batch:
+            for column, _ in legacy.values():
+                batch.drop_column(column)
+        for _, type_name in legacy.values():
+            sa.Enum(name=type_name).drop(bind, checkfirst=True)
+
+    for name, index_columns in INDEXES.items():
+        if name not in indexes:
+            op.create_index(name, "symbol_generations", index_columns)
+    if COMPLETED_TIMES_INDEX not in indexes:
+        op.create_index(
+            COMPLETED_TIMES_INDEX, "symbol_generations",
+            ["status", "started_at", "completed_at"],
+            postgresql_where=sa.text("status = 'completed'"),
+            sqlite_where=sa.text("status = 'completed'"),
+        )
+
+
+def downgrade():
+    bind = op.get_bind()
+    op.drop_index(COMPLETED_TIMES_INDEX, table_name="symbol_generations")
+    for name in INDEXES:
+        op.drop_index(name, table_name="symbol_generations")
+
+    # Recreate the enum types and columns as 0001 defined them
+    version_enums = {
+        column: sa.Enum(*values, name=type_name)
+        for column, type_name, values in LEGACY_VERSION_COLUMNS.values()
+    }
+    for enum in version_enums.values():
+        enum.create(bind, checkfirst=True)
+    with op.batch_alter_table("symbol_generations") as batch:
+        for column, enum in version_enums.items():
+            batch.add_column(sa.Column(column, enum, nullable=True))
+
+    # PostgreSQL enums need an explicit cast from the string column
+    postgres = bind.dialect.name == "postgresql"
+    for distro, (column, type_name, values) in LEGACY_VERSION_COLUMNS.items():
+        source = f"CAST(distro_version AS {type_name})" if postgres else "distro_version"
+        allowed = ", ".join(f"'{value}'" for value in values)
+        op.execute(
+            f"UPDATE symbol_generations SET {column} = {source} "
+            f"WHERE CAST(distro AS VARCHAR) = '{distro}' AND distro_version IN ({allowed})"
+        )
+    op.drop_column("symbol_generations", "distro_version")
@@ -0,0 +1,200 @@
+"""
+Response Cache
+
+Redis cache for the job list endpoints. Cached bodies are keyed by the
+request parameters plus a revision counter; any job state change bumps the
+counter, which makes every cached list unreachable at once (old entries
+simply expire). Hot public pages can also be kept in-process for a few
+seconds, which works with or without Redis.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional, Tuple, Union
+
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from app.redis_client import get_async_redis, get_sync_redis
+from app.responses import json_bytes, model_json
+
+logger = logging.getLogger(__name__)
+
+REVISION_KEY = "symgen:rev"
+CACHE_PREFIX = "symgen:cache:"
+# Upper bound on staleness for values that don't bump the revision (download counts)
+CACHE_TTL_SECONDS = 30
+# How long an expired fallback entry is kept for when rebuilding it fails
+STALE_RETENTION_SECONDS = 3600
+# In-process copies of hot pages, {key: (expires_at, body)} in LRU order.
+# Cleared on local invalidation; other processes' copies age out by TTL.
+# The lock is needed because invalidation also runs from threadpool threads.
+LOCAL_CACHE_MAX_ENTRIES = 128
+_local_cache: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+_local_lock = threading.Lock()
+
+
+async def cached_json(
+    namespace: str,
+    params: dict,
+    build: Callable[[], Awaitable[Union[BaseModel, dict]]],
+    local_ttl: Optional[float] = None,
+):
+    """
+    Return the cached JSON body for (namespace, params) or build and cache it.
+
+    The body is always rendered to bytes here, so the route's response_model
+    only documents the schema. With `local_ttl` the body is also kept in
+    this process for that many seconds, skipping Redis entirely on hits.
+    Without a reachable Redis the body is otherwise built on every call.
+    """
+    digest = hashlib.sha1(orjson.dumps(params, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    local_key = f"{namespace}:{digest}"
+    if local_ttl:
+        body = _local_get(local_key)
+        if body is not None:
+            return _json_response(body)
+
+    body = await _redis_cached(namespace, digest, build)
+    if local_ttl:
+        _local_put(local_key, body, local_ttl)
+    return _json_response(body)
+
+
+async def _redis_cached(
+    namespace: str,
+    digest: str,
+    build: Callable[[], Awaitable[Union[BaseModel, dict]]],
+) -> bytes:
+    """Fetch the rendered body from Redis under the current revision, or build it."""
+    redis = get_async_redis()
+    if redis is None:
+        return _render(await build())
+
+    try:
+        revision = await redis.get(REVISION_KEY) or b"0"
+        key = f"{CACHE_PREFIX}{namespace}:{revision.decode()}:{digest}"
+        body = await redis.get(key)
+    except Exception as e:
+        logger.warning(f"[Cache] Redis unavailable, skipping cache: {e}")
+        return _render(await build())
+
+    if body is None:
+        body = _render(await build())
+        try:
+            await redis.set(key, body, ex=CACHE_TTL_SECONDS)
+        except Exception as e:
+            logger.warning(f"[Cache] Failed to store {key}: {e}")
+
+    return body
+
+
+def _local_get(key: str) -> Optional[bytes]:
+    """Return a live in-process entry, marking it recently used."""
+    with _local_lock:
+        entry = _local_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, body = entry
+        if expires_at <= time.monotonic():
+            _local_cache.pop(key, None)
+            return None
+        _local_cache.move_to_end(key)
+        return body
+
+
+def _local_put(key: str, body: bytes, ttl: float):
+    """Store an in-process entry, evicting the least recently used ones."""
+    with _local_lock:
+        _local_cache[key] = (time.monotonic() + ttl, body)
+        _local_cache.move_to_end(key)
+        while len(_local_cache) > LOCAL_CACHE_MAX_ENTRIES:
+            _local_cache.popitem(last=False)
+
+
+async def cached_with_fallback(
+    name: str,
+    ttl: int,
+    build: Callable[[], Awaitable[Union[BaseModel, dict]]],
+):
+    """
+    Serve `name` from a Redis hash {ts, stale_at, body} for `ttl` seconds.
+
+    Once the entry is stale it is rebuilt; if `build()` raises, the stale
+    body is served with `X-Cache: stale` rather than failing the request.
+    """
+    redis = get_async_redis()
+    if redis is None:
+        return _json_response(_render(await build()))
+
+    key = f"{CACHE_PREFIX}{name}"
+    try:
+        entry = await redis.hgetall(key)
+    except Exception as e:
+        logger.warning(f"[Cache] Redis unavailable, skipping cache: {e}")
+        return _json_response(_render(await build()))
+
+    now = time.time()
+    if entry and float(entry[b"stale_at"]) > now:
+        return _json_response(entry[b"body"], cache_status="hit")
+
+    try:
+        body = _render(await build())
+    except Exception as e:
+        if not entry:
+            raise
+        logger.warning(f"[Cache] Rebuilding {key} failed, serving stale copy: {e}")
+        return _json_response(entry[b"body"], cache_status="stale")
+
+    try:
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={"ts": now, "stale_at": now + ttl, "body": body})
+            pipe.expire(key, ttl + STALE_RETENTION_SECONDS)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"[Cache] Failed to store {key}: {e}")
+
+    return _json_response(body, cache_status="miss")
+
+
+def _render(value: Union[BaseModel, dict]) -> bytes:
+    """Render a model with pydantic-core, or plain data with orjson."""
+    if isinstance(value, BaseModel):
+        return model_json(value)
+    return json_bytes(value)
+
+
+def _json_response(body: bytes, cache_status: Optional[str] = None) -> Response:
+    """Wrap an already rendered JSON body, tagging it with X-Cache if given."""
+    headers = {"X-Cache": cache_status} if cache_status else None
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def invalidate_sync():
+    """Bump the revision after a job change (blocking; safe from threads and workers)."""
+    with _local_lock:
+        _local_cache.clear()
+    redis = get_sync_redis()
+    if redis is None:
+        return
+    try:
+        redis.incr(REVISION_KEY)
+    except Exception as e:
+        logger.warning(f"[Cache] Failed to bump revision: {e}")
+
+
+async def invalidate():
+    """Bump the revision after a job change."""
+    with _local_lock:
+        _local_cache.clear()
+    redis = get_async_redis()
+    if redis is None:
+        return
+    try:
+        await redis.incr(REVISION_KEY)
+    except Exception as e:
+        logger.warning(f"[Cache] Failed to bump revision: {e}")
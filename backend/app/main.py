@@ -4,14 +4,21 @@ Symgen - Volatility3 Linux Symbol Generator
 A standalone application for generating Volatility3 Linux symbols using Docker containers.
 """
 
+import os
 import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.database import engine, Base
+from app.database import engine, async_engine, Base
+from app.middleware import DBSessionMiddleware
+from app.redis_client import close_async_redis
+from app.responses import ORJSONResponse
 from app.routers import symgen
+from app.services.symgen import symbol_generator
+from app.websocket import manager
+from app.worker import celery_enabled
 
 # Configure logging
 logging.basicConfig(
@@ -21,26 +28,42 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Schema is managed by Alembic (`alembic upgrade head`); create_all is a dev convenience
+AUTO_CREATE_TABLES = os.getenv("SYMGEN_AUTO_CREATE_TABLES") == "1"
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     # Startup
     logger.info("Starting Symgen application...")
     
-    # Create database tables
-    Base.metadata.create_all(bind=engine)
-    logger.info("Database tables created/verified")
+    if AUTO_CREATE_TABLES:
+        Base.metadata.create_all(bind=engine)
+        logger.info("Database tables created/verified")
+    
+    # Relay WebSocket broadcasts published by other processes
+    await manager.start_backplane()
+    
+    # Jobs run here unless Celery workers take them; warm their images up front
+    if not celery_enabled():
+        symbol_generator.start_preload()
     
     yield
     
     # Shutdown
     logger.info("Shutting down Symgen application...")
+    await manager.stop_backplane()
+    await close_async_redis()
+    await async_engine.dispose()
+    symbol_generator.close()
 
 
 app = FastAPI(
     title="Symgen",
     description="Volatility3 Linux Symbol Generator - Generate Linux kernel symbols automatically using Docker containers",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -53,6 +76,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Close each request's scoped database session
+app.add_middleware(DBSessionMiddleware)
+
 # Include routers
 app.include_router(symgen.router)
 
@@ -0,0 +1,28 @@
+"""
+ASGI Middleware
+"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.database import ScopedSession
+
+
+class DBSessionMiddleware:
+    """
+    Release the task-scoped database session once a request is finished.
+
+    Implemented as plain ASGI (not BaseHTTPMiddleware) so the endpoint runs
+    in the same asyncio task and therefore sees the same scoped session.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            await ScopedSession.remove()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, BigInteger, String, DateTime, func, Text, Enum as SQLEnum
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, func, Text, Index, text, Enum as SQLEnum
 from app.database import Base
 import enum
 
@@ -13,6 +13,16 @@ class SymGenStatus(str, enum.Enum):
     FAILED = "failed"
 
 
+# Statuses of a job that has not finished yet
+IN_PROGRESS_STATUSES = (
+    SymGenStatus.PENDING,
+    SymGenStatus.PULLING_IMAGE,
+    SymGenStatus.RUNNING,
+    SymGenStatus.DOWNLOADING_KERNEL,
+    SymGenStatus.GENERATING_SYMBOL,
+)
+
+
 class LinuxDistro(str, enum.Enum):
     UBUNTU = "ubuntu"
     DEBIAN = "debian"
@@ -68,23 +78,57 @@ class AlmaVersion(str, enum.Enum):
     ALMA_9 = "9"
 
 
+# Per-distro API field and version enum for each distro
+DISTRO_VERSION_FIELDS = {
+    LinuxDistro.UBUNTU: ("ubuntu_version", UbuntuVersion),
+    LinuxDistro.DEBIAN: ("debian_version", DebianVersion),
+    LinuxDistro.FEDORA: ("fedora_version", FedoraVersion),
+    LinuxDistro.CENTOS: ("centos_version", CentOSVersion),
+    LinuxDistro.RHEL: ("rhel_version", RHELVersion),
+    LinuxDistro.ORACLE: ("oracle_version", OracleVersion),
+    LinuxDistro.ROCKY: ("rocky_version", RockyVersion),
+    LinuxDistro.ALMA: ("alma_version", AlmaVersion),
+}
+
+
+def _distro_version_property(distro: LinuxDistro):
+    """Read-only per-distro version attribute derived from distro/distro_version."""
+    field, enum_cls = DISTRO_VERSION_FIELDS[distro]
+    
+    def getter(self):
+        if self.distro == distro and self.distro_version:
+            return enum_cls(self.distro_version)
+        return None
+    
+    getter.__name__ = field
+    return property(getter)
+
+
 class SymbolGeneration(Base):
     """Tracks Linux symbol generation jobs using Docker containers."""
     __tablename__ = "symbol_generations"
+    __table_args__ = (
+        # Duplicate/in-progress job lookup in /generate
+        Index("ix_symgen_lookup", "kernel_version", "distro", "distro_version", "status"),
+        # Portal filtering by distro release
+        Index("ix_distro_ver", "distro", "distro_version"),
+        # Status-filtered listings ordered by newest first (/jobs, /portal)
+        Index("ix_symgen_status_created", "status", "created_at"),
+        # Partial index backing the completion-time aggregates in /metrics
+        Index(
+            "ix_symgen_completed_times", "status", "started_at", "completed_at",
+            postgresql_where=text("status = 'completed'"),
+            sqlite_where=text("status = 'completed'"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     # Kernel info
     kernel_version = Column(String, nullable=False)  # e.g., "5.15.0-91-generic" or "5.10.0-28-amd64"
     # Linux distribution info
     distro = Column(SQLEnum(LinuxDistro, values_callable=lambda x: [e.value for e in x]), default=LinuxDistro.UBUNTU)
-    ubuntu_version = Column(SQLEnum(UbuntuVersion, values_callable=lambda x: [e.value for e in x]), nullable=True)
-    debian_version = Column(SQLEnum(DebianVersion, values_callable=lambda x: [e.value for e in x]), nullable=True)
-    fedora_version = Column(SQLEnum(FedoraVersion, values_callable=lambda x: [e.value for e in x]), nullable=True)
-    centos_version = Column(SQLEnum(CentOSVersion, values_callable=lambda x: [e.value for e in x]), nullable=True)
-    rhel_version = Column(SQLEnum(RHELVersion, values_callable=lambda x: [e.value for e in x]), nullable=True)
-    oracle_version = Column(SQLEnum(OracleVersion, values_callable=lambda x: [e.value for e in x]), nullable=True)
-    rocky_version = Column(SQLEnum(RockyVersion, values_callable=lambda x: [e.value for e in x]), nullable=True)
-    alma_version = Column(SQLEnum(AlmaVersion, values_callable=lambda x: [e.value for e in x]), nullable=True)
+    # Release of `distro` (e.g., "22.04" or "12"); validated per distro in the API schemas
+    distro_version = Column(String, nullable=True)
 
     # Job status
     status = Column(SQLEnum(SymGenStatus, values_callable=lambda x: [e.value for e in x]), default=SymGenStatus.PENDING)
@@ -102,3 +146,13 @@ class SymbolGeneration(Base):
     started_at = Column(DateTime(timezone=True), nullable=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Per-distro views of distro_version, kept for the API and service code
+    ubuntu_version = _distro_version_property(LinuxDistro.UBUNTU)
+    debian_version = _distro_version_property(LinuxDistro.DEBIAN)
+    fedora_version = _distro_version_property(LinuxDistro.FEDORA)
+    centos_version = _distro_version_property(LinuxDistro.CENTOS)
+    rhel_version = _distro_version_property(LinuxDistro.RHEL)
+    oracle_version = _distro_version_property(LinuxDistro.ORACLE)
+    rocky_version = _distro_version_property(LinuxDistro.ROCKY)
+    alma_version = _distro_version_property(LinuxDistro.ALMA)
@@ -0,0 +1,51 @@
+"""
+Redis Connections
+
+Shared Redis clients used for cross-process messaging. Redis is optional:
+when REDIS_URL is not set every helper returns None and callers fall back
+to in-process behaviour.
+"""
+
+import os
+from typing import Optional
+
+import redis
+import redis.asyncio as aioredis
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+_async_client: Optional[aioredis.Redis] = None
+_sync_client: Optional[redis.Redis] = None
+
+
+def redis_enabled() -> bool:
+    """Whether a Redis server is configured."""
+    return bool(REDIS_URL)
+
+
+def get_async_redis() -> Optional[aioredis.Redis]:
+    """Async client for the API event loop (created on first use)."""
+    global _async_client
+    if not REDIS_URL:
+        return None
+    if _async_client is None:
+        _async_client = aioredis.from_url(REDIS_URL)
+    return _async_client
+
+
+def get_sync_redis() -> Optional[redis.Redis]:
+    """Blocking client for threads and worker processes without a usable loop."""
+    global _sync_client
+    if not REDIS_URL:
+        return None
+    if _sync_client is None:
+        _sync_client = redis.Redis.from_url(REDIS_URL)
+    return _sync_client
+
+
+async def close_async_redis():
+    """Close the async client (called on application shutdown)."""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
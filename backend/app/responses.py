@@ -0,0 +1,80 @@
+"""
+Custom response classes.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from starlette.responses import FileResponse
+from starlette.types import Receive, Scope, Send
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered by orjson.
+
+    Used as the app's default response class. Naive datetimes in content
+    passed directly to the response are serialized as UTC.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NAIVE_UTC)
+
+
+def model_json(model: BaseModel) -> bytes:
+    """
+    Serialize a model straight to JSON bytes with pydantic-core.
+
+    Skips FastAPI's response validation and jsonable_encoder pass, which
+    dominate the cost of large list responses.
+    """
+    return model.__pydantic_serializer__.to_json(model)
+
+
+def json_bytes(value: Any) -> bytes:
+    """
+    Serialize plain data (dicts, dataclasses, enums, datetimes) with orjson.
+
+    OPT_UTC_Z writes UTC as "Z", matching pydantic's datetime output.
+    """
+    return orjson.dumps(value, option=orjson.OPT_UTC_Z)
+
+
+class SymbolFileResponse(FileResponse):
+    """
+    FileResponse tuned for large symbol archives.
+
+    When the ASGI server advertises the `http.response.zerocopysend`
+    extension the file descriptor is handed to the server, which can use
+    sendfile(2) instead of copying through userspace. Otherwise the file is
+    streamed in 1 MiB chunks rather than Starlette's default 64 KiB.
+    """
+
+    chunk_size = 1024 * 1024
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        zerocopy = "http.response.zerocopysend" in scope.get("extensions", {})
+        if not zerocopy or self.stat_result is None or scope["method"].upper() == "HEAD":
+            await super().__call__(scope, receive, send)
+            return
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        with open(self.path, mode="rb") as file:
+            await send(
+                {
+                    "type": "http.response.zerocopysend",
+                    "file": file,
+                    "count": self.stat_result.st_size,
+                    "more_body": False,
+                }
+            )
+        if self.background is not None:
+            await self.background()
@@ -5,158 +5,213 @@ API endpoints for generating and downloading Volatility3 Linux symbols.
 """
 
 import os
-import math
+import hashlib
+from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, WebSocket, WebSocketDisconnect
-from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+import orjson
+from fastapi import APIRouter, HTTPException, status, BackgroundTasks, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import and_, case, desc, func, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
-from app.database import get_db
+from app.cache import cached_json, cached_with_fallback, invalidate
+from app.database import AsyncSessionLocal, ScopedSession, async_engine
+from app.responses import SymbolFileResponse, json_bytes
 from app.models import (
-    SymbolGeneration, SymGenStatus, LinuxDistro,
+    SymbolGeneration, SymGenStatus, LinuxDistro, IN_PROGRESS_STATUSES, DISTRO_VERSION_FIELDS,
     UbuntuVersion, DebianVersion, FedoraVersion, CentOSVersion,
     RHELVersion, OracleVersion, RockyVersion, AlmaVersion
 )
 from app.schemas import (
-    SymGenCreate, SymGenResponse, SymGenListResponse, 
-    GeneratedSymbolResponse, SymbolPortalResponse, KernelParseResponse,
-    MetricsResponse
+    SymGenCreate, JobBatchDelete, SymGenResponse, SymGenListResponse, 
+    SymbolPortalResponse, KernelParseResponse, MetricsResponse
 )
 from app.services.symgen import (
     symbol_generator, parse_kernel_version,
-    get_symbol_filename, SYMBOLS_DIR
+    get_symbol_filename, SYMBOLS_DIR, MAX_CONCURRENT_JOBS
 )
-from app.websocket import manager
+from app.websocket import manager, serialize_job
+from app.worker import celery_enabled, enqueue_generation
 
 router = APIRouter(prefix="/api/symgen", tags=["symgen"])
 
+# Timestamps need normalizing before comparison on SQLite (see _created_at_key)
+_SQLITE = async_engine.dialect.name == "sqlite"
+
+# Shared clause for "job still running", reused across endpoints
+_IN_PROGRESS_FILTER = SymbolGeneration.status.in_(IN_PROGRESS_STATUSES)
+
+# List items carry only their distro's version field, e.g. {"ubuntu_version": "22.04"}
+_VERSION_FIELD = {distro: field for distro, (field, _) in DISTRO_VERSION_FIELDS.items()}
+# SymGenResponse fields after the version fields, in schema order
+_JOB_ITEM_TAIL = (
+    "status", "status_message", "error_message", "symbol_filename", "symbol_file_size",
+    "download_count", "started_at", "completed_at", "created_at",
+)
+# Columns /jobs selects to build its list items
+_JOB_COLUMNS = (
+    SymbolGeneration.id,
+    SymbolGeneration.kernel_version,
+    SymbolGeneration.distro,
+    SymbolGeneration.distro_version,
+    *(getattr(SymbolGeneration, name) for name in _JOB_ITEM_TAIL),
+)
+# Static payloads only change on deploy; clients revalidate with the ETag afterwards
+_STATIC_CACHE_CONTROL = "public, max-age=3600"
+
+
+def _add_version_field(item: dict, distro: Optional[LinuxDistro], distro_version: Optional[str]):
+    """Set the one version field that applies to `distro`, if known."""
+    field = _VERSION_FIELD.get(distro)
+    if field and distro_version:
+        item[field] = distro_version
+
 
 # ============================================================
 # Symbol Generation Endpoints
 # ============================================================
 
+async def _worker_queue_status() -> dict:
+    """
+    Queue counts from the jobs table, for when Celery workers run the jobs.
+    
+    The in-process JobQueue is empty then, so pending jobs count as queued
+    and the other in-progress ones as running.
+    """
+    db = ScopedSession()
+    is_pending = SymbolGeneration.status == SymGenStatus.PENDING
+    row = (await db.execute(
+        select(
+            func.count(case((is_pending, 1))).label("queued"),
+            func.count(case((~is_pending, 1))).label("running"),
+        ).where(_IN_PROGRESS_FILTER)
+    )).one()
+    return {"running": row.running, "queued": row.queued, "max_concurrent": MAX_CONCURRENT_JOBS}
+
+
 @router.get("/status")
-def get_symgen_status():
+async def get_symgen_status():
     """Check if symbol generation is available (Docker connected)."""
-    queue_status = symbol_generator.get_queue_status()
+    if celery_enabled():
+        queue_status = await _worker_queue_status()
+    else:
+        queue_status = symbol_generator.get_queue_status()
+    # A failed connection is retried here at most every DOCKER_RECONNECT_INTERVAL
+    available = await run_in_threadpool(symbol_generator.is_available)
     return {
-        "available": symbol_generator.is_available(),
-        "message": "Docker is connected" if symbol_generator.is_available() 
+        "available": available,
+        "message": "Docker is connected" if available 
                    else "Docker is not available. Make sure Docker socket is mounted.",
         "queue": queue_status,
     }
 
 
+# Aggregates over the whole table; a few seconds of staleness is fine
+_METRICS_TTL = 15
+
+
+def _format_bytes(size_bytes: int) -> str:
+    """Format a storage size, e.g. 4.9 KB."""
+    size = float(size_bytes)
+    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} PB"
+
+
+def _format_duration(seconds: float) -> str:
+    """Format a duration as seconds, minutes or hours, e.g. 42s or 1.5m."""
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    elif seconds < 3600:
+        mins = seconds / 60
+        return f"{mins:.1f}m"
+    else:
+        hours = seconds / 3600
+        return f"{hours:.1f}h"
+
+
+def _completion_seconds(dialect_name: str):
+    """SQL expression for a job's completion time in seconds on the given dialect."""
+    if dialect_name == "sqlite":
+        # julianday() is a float day count; round away its sub-millisecond noise
+        return func.round((
+            func.julianday(SymbolGeneration.completed_at)
+            - func.julianday(SymbolGeneration.started_at)
+        ) * 86400.0, 3)
+    return func.extract("epoch", SymbolGeneration.completed_at - SymbolGeneration.started_at)
+
+
 @router.get("/metrics", response_model=MetricsResponse)
-def get_metrics(db: Session = Depends(get_db)):
+async def get_metrics():
     """Get system metrics including storage usage and completion times."""
-    from sqlalchemy import func
+    return await cached_with_fallback("metrics:v1", _METRICS_TTL, _compute_metrics)
+
+
+async def _compute_metrics() -> dict:
+    """Run the /metrics aggregate query (uncached)."""
+    db = ScopedSession()
+    is_completed = SymbolGeneration.status == SymGenStatus.COMPLETED
+    completion_seconds = _completion_seconds(db.bind.dialect.name)
+    # Only completed jobs with a positive duration count towards timing stats
+    completed_seconds = case((and_(is_completed, completion_seconds > 0), completion_seconds))
+    
+    # All counters and aggregates in a single pass over the table
+    row = (await db.execute(
+        select(
+            func.count(SymbolGeneration.id).label("total_jobs"),
+            func.count(case((is_completed, 1))).label("completed_jobs"),
+            func.count(case((SymbolGeneration.status == SymGenStatus.FAILED, 1))).label("failed_jobs"),
+            func.count(case((_IN_PROGRESS_FILTER, 1))).label("in_progress_jobs"),
+            func.count(case((
+                and_(is_completed, SymbolGeneration.symbol_file_size.isnot(None)), 1
+            ))).label("total_symbols"),
+            func.coalesce(func.sum(case((is_completed, SymbolGeneration.symbol_file_size))), 0)
+                .label("total_storage_bytes"),
+            func.coalesce(func.sum(SymbolGeneration.download_count), 0).label("total_downloads"),
+            func.avg(completed_seconds).label("avg_completion_time_seconds"),
+            func.min(completed_seconds).label("fastest_job_seconds"),
+            func.max(completed_seconds).label("slowest_job_seconds"),
+        )
+    )).one()
     
-    # Job counts
-    total_jobs = db.query(SymbolGeneration).count()
-    completed_jobs = db.query(SymbolGeneration).filter(
-        SymbolGeneration.status == SymGenStatus.COMPLETED
-    ).count()
-    failed_jobs = db.query(SymbolGeneration).filter(
-        SymbolGeneration.status == SymGenStatus.FAILED
-    ).count()
-    in_progress_jobs = db.query(SymbolGeneration).filter(
-        SymbolGeneration.status.in_([
-            SymGenStatus.PENDING, SymGenStatus.PULLING_IMAGE,
-            SymGenStatus.RUNNING, SymGenStatus.DOWNLOADING_KERNEL,
-            SymGenStatus.GENERATING_SYMBOL
-        ])
-    ).count()
-    
-    # Storage metrics
-    storage_result = db.query(
-        func.count(SymbolGeneration.id),
-        func.coalesce(func.sum(SymbolGeneration.symbol_file_size), 0)
-    ).filter(
-        SymbolGeneration.status == SymGenStatus.COMPLETED,
-        SymbolGeneration.symbol_file_size.isnot(None)
-    ).first()
-    
-    total_symbols = storage_result[0] if storage_result else 0
-    total_storage_bytes = int(storage_result[1]) if storage_result else 0
-    
-    # Format storage size
-    def format_bytes(size_bytes: int) -> str:
-        size = float(size_bytes)
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} PB"
-    
-    total_storage_formatted = format_bytes(total_storage_bytes)
-    
-    # Total downloads
-    downloads_result = db.query(
-        func.coalesce(func.sum(SymbolGeneration.download_count), 0)
-    ).scalar()
-    total_downloads = int(downloads_result) if downloads_result else 0
-    
-    # Completion time metrics (only for completed jobs with both timestamps)
-    completed_with_times = db.query(SymbolGeneration).filter(
-        SymbolGeneration.status == SymGenStatus.COMPLETED,
-        SymbolGeneration.started_at.isnot(None),
-        SymbolGeneration.completed_at.isnot(None)
-    ).all()
-    
-    completion_times = []
-    for job in completed_with_times:
-        if job.started_at and job.completed_at:
-            delta = (job.completed_at - job.started_at).total_seconds()
-            if delta > 0:
-                completion_times.append(delta)
-    
-    avg_completion_time_seconds = None
-    avg_completion_time_formatted = None
-    fastest_job_seconds = None
-    slowest_job_seconds = None
-    
-    if completion_times:
-        avg_completion_time_seconds = sum(completion_times) / len(completion_times)
-        fastest_job_seconds = min(completion_times)
-        slowest_job_seconds = max(completion_times)
-        
-        # Format average time
-        def format_duration(seconds: float) -> str:
-            if seconds < 60:
-                return f"{seconds:.0f}s"
-            elif seconds < 3600:
-                mins = seconds / 60
-                return f"{mins:.1f}m"
-            else:
-                hours = seconds / 3600
-                return f"{hours:.1f}h"
-        
-        avg_completion_time_formatted = format_duration(avg_completion_time_seconds)
-    
-    return MetricsResponse(
-        total_jobs=total_jobs,
-        completed_jobs=completed_jobs,
-        failed_jobs=failed_jobs,
-        in_progress_jobs=in_progress_jobs,
-        total_symbols=total_symbols,
+    total_storage_bytes = int(row.total_storage_bytes)
+    avg_completion_time_seconds = (
+        float(row.avg_completion_time_seconds)
+        if row.avg_completion_time_seconds is not None else None
+    )
+    
+    # Plain dict in MetricsResponse field order; rendered by orjson, no model
+    return dict(
+        total_jobs=row.total_jobs,
+        completed_jobs=row.completed_jobs,
+        failed_jobs=row.failed_jobs,
+        in_progress_jobs=row.in_progress_jobs,
+        total_symbols=row.total_symbols,
         total_storage_bytes=total_storage_bytes,
-        total_storage_formatted=total_storage_formatted,
-        total_downloads=total_downloads,
+        total_storage_formatted=_format_bytes(total_storage_bytes),
+        total_downloads=int(row.total_downloads),
         avg_completion_time_seconds=avg_completion_time_seconds,
-        avg_completion_time_formatted=avg_completion_time_formatted,
-        fastest_job_seconds=fastest_job_seconds,
-        slowest_job_seconds=slowest_job_seconds
+        avg_completion_time_formatted=(
+            _format_duration(avg_completion_time_seconds)
+            if avg_completion_time_seconds is not None else None
+        ),
+        fastest_job_seconds=(
+            float(row.fastest_job_seconds) if row.fastest_job_seconds is not None else None
+        ),
+        slowest_job_seconds=(
+            float(row.slowest_job_seconds) if row.slowest_job_seconds is not None else None
+        ),
     )
 
 
 @router.post("/generate", response_model=SymGenResponse)
 async def create_symbol_generation(
     request: SymGenCreate,
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
+    background_tasks: BackgroundTasks
 ):
     """
     Start a new symbol generation job.
@@ -164,57 +219,36 @@ async def create_symbol_generation(
     Spins up a Linux Docker container (Ubuntu or Debian), downloads kernel debug symbols,
     and generates a Volatility3 symbol file.
     """
-    if not symbol_generator.is_available():
+    db = ScopedSession()
+    # Celery workers run the containers with their own Docker connection
+    if not celery_enabled() and not await run_in_threadpool(symbol_generator.is_available):
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Docker is not available. Symbol generation requires Docker access."
         )
     
     # Validate distro-specific version is provided
-    version_requirements = {
-        LinuxDistro.UBUNTU: ("ubuntu_version", request.ubuntu_version),
-        LinuxDistro.DEBIAN: ("debian_version", request.debian_version),
-        LinuxDistro.FEDORA: ("fedora_version", request.fedora_version),
-        LinuxDistro.CENTOS: ("centos_version", request.centos_version),
-        LinuxDistro.RHEL: ("rhel_version", request.rhel_version),
-        LinuxDistro.ORACLE: ("oracle_version", request.oracle_version),
-        LinuxDistro.ROCKY: ("rocky_version", request.rocky_version),
-        LinuxDistro.ALMA: ("alma_version", request.alma_version),
-    }
-    
-    version_field, version_value = version_requirements.get(request.distro, (None, None))
-    if version_field and not version_value:
+    version_value = request.selected_version
+    if not version_value:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"{version_field} is required when distro is {request.distro.value.capitalize()}"
+            detail=f"{request.version_field} is required when distro is {request.distro.value.capitalize()}"
         )
     
-    # Build base query for this kernel+distro+version combination
+    # Base query for this kernel+distro+version combination
+    distro_version = version_value.value
+    
     def build_job_query():
-        query = db.query(SymbolGeneration).filter(
+        return select(SymbolGeneration).where(
             SymbolGeneration.kernel_version == request.kernel_version,
-            SymbolGeneration.distro == request.distro
+            SymbolGeneration.distro == request.distro,
+            SymbolGeneration.distro_version == distro_version
         )
-        # Filter by the appropriate version field
-        version_filters = {
-            LinuxDistro.UBUNTU: (SymbolGeneration.ubuntu_version, request.ubuntu_version),
-            LinuxDistro.DEBIAN: (SymbolGeneration.debian_version, request.debian_version),
-            LinuxDistro.FEDORA: (SymbolGeneration.fedora_version, request.fedora_version),
-            LinuxDistro.CENTOS: (SymbolGeneration.centos_version, request.centos_version),
-            LinuxDistro.RHEL: (SymbolGeneration.rhel_version, request.rhel_version),
-            LinuxDistro.ORACLE: (SymbolGeneration.oracle_version, request.oracle_version),
-            LinuxDistro.ROCKY: (SymbolGeneration.rocky_version, request.rocky_version),
-            LinuxDistro.ALMA: (SymbolGeneration.alma_version, request.alma_version),
-        }
-        version_field, version_value = version_filters.get(request.distro, (None, None))
-        if version_field is not None:
-            query = query.filter(version_field == version_value)
-        return query
     
     # Check for existing completed job
-    completed_job = build_job_query().filter(
+    completed_job = (await db.scalars(build_job_query().where(
         SymbolGeneration.status == SymGenStatus.COMPLETED
-    ).first()
+    ).limit(1))).first()
     
     if completed_job:
         # Verify the symbol file still exists
@@ -223,16 +257,13 @@ async def create_symbol_generation(
         # Symbol file missing, mark job as failed so user can retry
         completed_job.status = SymGenStatus.FAILED
         completed_job.error_message = "Symbol file was deleted"
-        db.commit()
+        await db.commit()
+        await invalidate()
     
     # Check for in-progress job
-    in_progress = build_job_query().filter(
-        SymbolGeneration.status.in_([
-            SymGenStatus.PENDING, SymGenStatus.PULLING_IMAGE,
-            SymGenStatus.RUNNING, SymGenStatus.DOWNLOADING_KERNEL,
-            SymGenStatus.GENERATING_SYMBOL
-        ])
-    ).first()
+    in_progress = (await db.scalars(
+        build_job_query().where(_IN_PROGRESS_FILTER).limit(1)
+    )).first()
     
     if in_progress:
         raise HTTPException(
@@ -244,63 +275,49 @@ async def create_symbol_generation(
     job = SymbolGeneration(
         kernel_version=request.kernel_version,
         distro=request.distro,
-        ubuntu_version=request.ubuntu_version,
-        debian_version=request.debian_version,
-        fedora_version=request.fedora_version,
-        centos_version=request.centos_version,
-        rhel_version=request.rhel_version,
-        oracle_version=request.oracle_version,
-        rocky_version=request.rocky_version,
-        alma_version=request.alma_version,
+        distro_version=distro_version,
         status=SymGenStatus.PENDING,
         status_message="Job created, waiting to start...",
     )
     db.add(job)
-    db.commit()
-    db.refresh(job)
+    await db.commit()
+    await db.refresh(job)
+    await invalidate()
     
     # Broadcast job creation via WebSocket immediately (works from async context)
-    await manager.broadcast({
-        "type": "job_update",
-        "job": {
-            "id": job.id,
-            "kernel_version": job.kernel_version,
-            "distro": job.distro.value if job.distro else None,
-            "ubuntu_version": job.ubuntu_version.value if job.ubuntu_version else None,
-            "debian_version": job.debian_version.value if job.debian_version else None,
-            "fedora_version": job.fedora_version.value if job.fedora_version else None,
-            "centos_version": job.centos_version.value if job.centos_version else None,
-            "rhel_version": job.rhel_version.value if job.rhel_version else None,
-            "oracle_version": job.oracle_version.value if job.oracle_version else None,
-            "rocky_version": job.rocky_version.value if job.rocky_version else None,
-            "alma_version": job.alma_version.value if job.alma_version else None,
-            "status": job.status.value if job.status else None,
-            "status_message": job.status_message,
-            "error_message": job.error_message,
-            "symbol_filename": job.symbol_filename,
-            "symbol_file_size": job.symbol_file_size,
-            "download_count": job.download_count,
-            "started_at": job.started_at.isoformat() if job.started_at else None,
-            "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-            "created_at": job.created_at.isoformat() if job.created_at else None,
-        }
-    }, channel="symgen")
-    
-    # Start generation in background
-    background_tasks.add_task(
-        symbol_generator.generate_symbol,
-        job.id,
-        request.kernel_version,
-        request.distro,
-        request.ubuntu_version,
-        request.debian_version,
-        request.fedora_version,
-        request.centos_version,
-        request.rhel_version,
-        request.oracle_version,
-        request.rocky_version,
-        request.alma_version,
-    )
+    await manager.broadcast({"type": "job_update", "job": serialize_job(job)}, channel="symgen")
+    
+    # Hand off to a Celery worker if configured, otherwise run in-process
+    if celery_enabled():
+        await run_in_threadpool(
+            enqueue_generation,
+            job.id,
+            request.kernel_version,
+            request.distro,
+            ubuntu_version=request.ubuntu_version,
+            debian_version=request.debian_version,
+            fedora_version=request.fedora_version,
+            centos_version=request.centos_version,
+            rhel_version=request.rhel_version,
+            oracle_version=request.oracle_version,
+            rocky_version=request.rocky_version,
+            alma_version=request.alma_version,
+        )
+    else:
+        background_tasks.add_task(
+            symbol_generator.generate_symbol,
+            job.id,
+            request.kernel_version,
+            request.distro,
+            request.ubuntu_version,
+            request.debian_version,
+            request.fedora_version,
+            request.centos_version,
+            request.rhel_version,
+            request.oracle_version,
+            request.rocky_version,
+            request.alma_version,
+        )
     
     return job
 
@@ -340,70 +357,180 @@ def parse_kernel_banner(banner: str):
     )
 
 
+def _created_at_key(value):
+    """
+    created_at as compared by the keyset seek.
+    
+    SQLite stores timestamps as text: server defaults as "YYYY-MM-DD HH:MM:SS"
+    but bound datetimes with microseconds, so a raw comparison would count
+    the cursor row as older than itself. Both sides are normalized there.
+    """
+    if _SQLITE:
+        return func.strftime("%Y-%m-%d %H:%M:%f", value)
+    return value
+
+
+def _seek_page(
+    query,
+    page: int,
+    page_size: int,
+    cursor_created_at: Optional[datetime],
+    cursor_id: Optional[int],
+):
+    """
+    Position `query` on the requested page, newest first.
+    
+    With a cursor the page is located by seeking on the (created_at, id)
+    key instead of OFFSET, so deep pages cost the same as the first one.
+    The caller applies the LIMIT.
+    """
+    created_at = _created_at_key(SymbolGeneration.created_at)
+    if cursor_created_at is not None and cursor_id is not None:
+        query = query.where(
+            tuple_(created_at, SymbolGeneration.id)
+            < tuple_(_created_at_key(cursor_created_at), cursor_id)
+        )
+    else:
+        query = query.offset((page - 1) * page_size)
+    return query.order_by(desc(created_at), desc(SymbolGeneration.id))
+
+
+async def _count_pages(db: AsyncSession, query, page_size: int, include_total: bool):
+    """Return (total, total_pages) for `query`, or (None, None) when not requested."""
+    if not include_total:
+        return None, None
+    total = await db.scalar(select(func.count()).select_from(query.subquery()))
+    return total, (-(-total // page_size) if total > 0 else 1)
+
+
+async def _paginate(
+    db: AsyncSession,
+    query,
+    page: int,
+    page_size: int,
+    cursor_created_at: Optional[datetime],
+    cursor_id: Optional[int],
+    include_total: bool,
+):
+    """
+    Fetch one page of `query` (see _seek_page).
+    
+    `query` may select the SymbolGeneration entity or a column projection
+    that includes created_at and id. Returns (rows, total, total_pages,
+    next_cursor); the totals are None unless include_total is set.
+    """
+    total, total_pages = await _count_pages(db, query, page_size, include_total)
+    
+    # Fetch one extra row to know whether another page follows
+    result = await db.execute(
+        _seek_page(query, page, page_size, cursor_created_at, cursor_id).limit(page_size + 1)
+    )
+    rows = result.scalars().all() if len(query.column_descriptions) == 1 else result.all()
+    
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = {"created_at": rows[-1].created_at, "id": rows[-1].id}
+    
+    return rows, total, total_pages, next_cursor
+
+
 @router.get("/jobs", response_model=SymGenListResponse)
-def list_generation_jobs(
+async def list_generation_jobs(
     page: int = 1,
     page_size: int = 10,
     status_filter: Optional[str] = None,
-    db: Session = Depends(get_db)
+    cursor_created_at: Optional[datetime] = None,
+    cursor_id: Optional[int] = None,
+    include_total: bool = True
 ):
     """
     List all symbol generation jobs with pagination.
     
+    Pass the previous response's next_cursor as cursor_created_at/cursor_id
+    for keyset pagination, and include_total=false to skip the count query.
+    
     status_filter can be:
     - 'completed' - only completed jobs
     - 'failed' - only failed jobs  
     - 'in_progress' - pending, pulling_image, running, downloading_kernel, generating_symbol
     - A specific SymGenStatus value
     """
-    query = db.query(SymbolGeneration)
+    params = {
+        "page": page, "page_size": page_size, "status_filter": status_filter,
+        "cursor_created_at": cursor_created_at, "cursor_id": cursor_id,
+        "include_total": include_total,
+    }
+    return await cached_json("jobs", params, lambda: _query_jobs(**params))
+
+
+async def _query_jobs(
+    page: int,
+    page_size: int,
+    status_filter: Optional[str],
+    cursor_created_at: Optional[datetime],
+    cursor_id: Optional[int],
+    include_total: bool,
+) -> dict:
+    """Run the /jobs query (uncached); returns a SymGenListResponse-shaped dict."""
+    db = ScopedSession()
+    # Plain rows in a fixed column order; no ORM instances or identity map
+    query = select(*_JOB_COLUMNS)
     
     if status_filter:
         if status_filter == "in_progress":
             # Filter for all in-progress statuses
-            query = query.filter(SymbolGeneration.status.in_([
-                SymGenStatus.PENDING,
-                SymGenStatus.PULLING_IMAGE,
-                SymGenStatus.RUNNING,
-                SymGenStatus.DOWNLOADING_KERNEL,
-                SymGenStatus.GENERATING_SYMBOL
-            ]))
+            query = query.where(_IN_PROGRESS_FILTER)
         elif status_filter == "completed":
-            query = query.filter(SymbolGeneration.status == SymGenStatus.COMPLETED)
+            query = query.where(SymbolGeneration.status == SymGenStatus.COMPLETED)
         elif status_filter == "failed":
-            query = query.filter(SymbolGeneration.status == SymGenStatus.FAILED)
+            query = query.where(SymbolGeneration.status == SymGenStatus.FAILED)
         else:
             # Try to match a specific status
             try:
                 status_enum = SymGenStatus(status_filter)
-                query = query.filter(SymbolGeneration.status == status_enum)
+                query = query.where(SymbolGeneration.status == status_enum)
             except ValueError:
                 pass  # Invalid status, ignore filter
     
-    total = query.count()
-    total_pages = math.ceil(total / page_size) if total > 0 else 1
-    
-    jobs = query.order_by(desc(SymbolGeneration.created_at))\
-                .offset((page - 1) * page_size)\
-                .limit(page_size)\
-                .all()
+    jobs, total, total_pages, next_cursor = await _paginate(
+        db, query, page, page_size, cursor_created_at, cursor_id, include_total
+    )
     
-    return SymGenListResponse(
-        items=jobs,
+    # Rows come from our own table and orjson encodes the item dicts directly,
+    # so no pydantic model is built or validated for the page
+    return dict(
+        items=[_job_item(job) for job in jobs],
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=next_cursor
     )
 
 
+def _job_item(job) -> dict:
+    """JSON-ready SymGenResponse dict from a _JOB_COLUMNS row, null fields left out."""
+    item = {
+        "id": job.id,
+        "kernel_version": job.kernel_version,
+        "distro": job.distro or LinuxDistro.UBUNTU,
+    }
+    _add_version_field(item, job.distro, job.distro_version)
+    for name in _JOB_ITEM_TAIL:
+        value = getattr(job, name)
+        if value is not None:
+            item[name] = value
+    return item
+
+
 @router.get("/jobs/{job_id}", response_model=SymGenResponse)
-def get_generation_job(
-    job_id: int,
-    db: Session = Depends(get_db)
+async def get_generation_job(
+    job_id: int
 ):
     """Get details of a specific symbol generation job."""
-    job = db.query(SymbolGeneration).filter(SymbolGeneration.id == job_id).first()
+    db = ScopedSession()
+    job = await db.get(SymbolGeneration, job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -413,12 +540,12 @@ def get_generation_job(
 
 
 @router.post("/jobs/{job_id}/cancel")
-def cancel_generation_job(
-    job_id: int,
-    db: Session = Depends(get_db)
+async def cancel_generation_job(
+    job_id: int
 ):
     """Cancel a running symbol generation job."""
-    job = db.query(SymbolGeneration).filter(SymbolGeneration.id == job_id).first()
+    db = ScopedSession()
+    job = await db.get(SymbolGeneration, job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -431,7 +558,7 @@ def cancel_generation_job(
             detail=f"Cannot cancel job with status: {job.status.value}"
         )
     
-    success = symbol_generator.cancel_job(job_id)
+    success = await symbol_generator.cancel_job_async(job_id)
     
     return {
         "success": success,
@@ -440,19 +567,19 @@ def cancel_generation_job(
 
 
 @router.delete("/jobs/{job_id}")
-def delete_generation_job(
-    job_id: int,
-    db: Session = Depends(get_db)
+async def delete_generation_job(
+    job_id: int
 ):
     """Delete a symbol generation job and its associated files."""
-    job = db.query(SymbolGeneration).filter(SymbolGeneration.id == job_id).first()
+    db = ScopedSession()
+    job = await db.get(SymbolGeneration, job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Symbol generation job not found"
         )
     
-    success = symbol_generator.delete_job(job_id)
+    success = await run_in_threadpool(symbol_generator.delete_job, job_id)
     
     if not success:
         raise HTTPException(
@@ -466,91 +593,256 @@ def delete_generation_job(
     }
 
 
+@router.post("/jobs/delete")
+async def delete_generation_jobs(request: JobBatchDelete):
+    """Delete several symbol generation jobs and their files in one call."""
+    deleted = await run_in_threadpool(symbol_generator.delete_jobs, request.job_ids)
+    
+    return {
+        "success": True,
+        "deleted": deleted,
+        "message": f"Deleted {len(deleted)} of {len(request.job_ids)} jobs"
+    }
+
+
 # ============================================================
 # Symbol Portal (Public Download) Endpoints
 # ============================================================
 
+# Public listing; page 1 takes most of the traffic and may lag a few seconds
+_PORTAL_LOCAL_TTL = 10
+# Page sizes above this are streamed instead of rendered (and cached) whole
+_PORTAL_STREAM_THRESHOLD = 100
+
+_PORTAL_COLUMNS = (
+    SymbolGeneration.id,
+    SymbolGeneration.kernel_version,
+    SymbolGeneration.distro,
+    SymbolGeneration.distro_version,
+    SymbolGeneration.symbol_filename,
+    SymbolGeneration.symbol_file_size,
+    SymbolGeneration.download_count,
+    SymbolGeneration.created_at,
+)
+
+
 @router.get("/portal", response_model=SymbolPortalResponse)
-def list_available_symbols(
+async def list_available_symbols(
     page: int = 1,
     page_size: int = 20,
     distro: Optional[LinuxDistro] = None,
     ubuntu_version: Optional[UbuntuVersion] = None,
     debian_version: Optional[DebianVersion] = None,
     search: Optional[str] = None,
-    db: Session = Depends(get_db)
+    cursor_created_at: Optional[datetime] = None,
+    cursor_id: Optional[int] = None,
+    include_total: bool = True,
+    stream: Optional[str] = None
 ):
     """
     List all completed/available symbols for download.
     
-    This endpoint is public for the symbol portal.
+    This endpoint is public for the symbol portal. Supports the same keyset
+    cursor and include_total parameters as /jobs. Pages larger than
+    _PORTAL_STREAM_THRESHOLD are streamed as they are read. With
+    `stream=ndjson` the page is streamed as newline-delimited JSON items
+    instead, one row at a time from a server-side cursor.
     """
-    query = db.query(SymbolGeneration).filter(
+    if stream is not None:
+        if stream != "ndjson":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Unsupported stream format, expected 'ndjson'"
+            )
+        query = _seek_page(
+            _portal_query(distro, ubuntu_version, debian_version, search),
+            page, page_size, cursor_created_at, cursor_id
+        ).limit(page_size)
+        return StreamingResponse(_stream_portal(query), media_type="application/x-ndjson")
+    
+    if page_size > _PORTAL_STREAM_THRESHOLD:
+        # Large pages are written row by row instead of buffered (and not cached)
+        return StreamingResponse(
+            _stream_portal_page(
+                _portal_query(distro, ubuntu_version, debian_version, search),
+                page, page_size, cursor_created_at, cursor_id, include_total
+            ),
+            media_type="application/json"
+        )
+    
+    params = {
+        "page": page, "page_size": page_size, "distro": distro,
+        "ubuntu_version": ubuntu_version, "debian_version": debian_version,
+        "search": search, "cursor_created_at": cursor_created_at,
+        "cursor_id": cursor_id, "include_total": include_total,
+    }
+    return await cached_json(
+        "portal", params, lambda: _query_portal(**params), local_ttl=_PORTAL_LOCAL_TTL
+    )
+
+
+def _portal_query(
+    distro: Optional[LinuxDistro],
+    ubuntu_version: Optional[UbuntuVersion],
+    debian_version: Optional[DebianVersion],
+    search: Optional[str],
+):
+    """Build the filtered (unordered, unpaginated) /portal select."""
+    # Only the columns the portal shows; skips TEXT columns like error_message
+    query = select(*_PORTAL_COLUMNS).where(
         SymbolGeneration.status == SymGenStatus.COMPLETED,
         SymbolGeneration.symbol_filename.isnot(None)
     )
     
     if distro:
-        query = query.filter(SymbolGeneration.distro == distro)
+        query = query.where(SymbolGeneration.distro == distro)
     
     if ubuntu_version:
-        query = query.filter(SymbolGeneration.ubuntu_version == ubuntu_version)
+        query = query.where(
+            SymbolGeneration.distro == LinuxDistro.UBUNTU,
+            SymbolGeneration.distro_version == ubuntu_version.value
+        )
     
     if debian_version:
-        query = query.filter(SymbolGeneration.debian_version == debian_version)
+        query = query.where(
+            SymbolGeneration.distro == LinuxDistro.DEBIAN,
+            SymbolGeneration.distro_version == debian_version.value
+        )
     
     if search:
-        query = query.filter(SymbolGeneration.kernel_version.ilike(f"%{search}%"))
-    
-    total = query.count()
-    total_pages = math.ceil(total / page_size) if total > 0 else 1
-    
-    symbols = query.order_by(desc(SymbolGeneration.created_at))\
-                   .offset((page - 1) * page_size)\
-                   .limit(page_size)\
-                   .all()
-    
-    items = [
-        GeneratedSymbolResponse(
-            id=s.id,
-            kernel_version=s.kernel_version,
-            distro=s.distro or LinuxDistro.UBUNTU,
-            ubuntu_version=s.ubuntu_version,
-            debian_version=s.debian_version,
-            fedora_version=s.fedora_version,
-            centos_version=s.centos_version,
-            rhel_version=s.rhel_version,
-            oracle_version=s.oracle_version,
-            rocky_version=s.rocky_version,
-            alma_version=s.alma_version,
-            symbol_filename=s.symbol_filename,
-            symbol_file_size=s.symbol_file_size or 0,
-            download_count=s.download_count,
-            created_at=s.created_at
+        query = query.where(SymbolGeneration.kernel_version.ilike(f"%{search}%"))
+    
+    return query
+
+
+def _portal_item(s) -> dict:
+    """JSON-ready GeneratedSymbolResponse dict from a _PORTAL_COLUMNS row, nulls left out."""
+    item = {
+        "id": s.id,
+        "kernel_version": s.kernel_version,
+        "distro": s.distro or LinuxDistro.UBUNTU,
+    }
+    _add_version_field(item, s.distro, s.distro_version)
+    item["symbol_filename"] = s.symbol_filename
+    item["symbol_file_size"] = s.symbol_file_size or 0
+    item["download_count"] = s.download_count
+    item["created_at"] = s.created_at
+    return item
+
+
+async def _stream_portal(query):
+    """Yield portal rows as NDJSON lines without materializing the page."""
+    # StreamingResponse iterates in its own task, outside the request's scoped
+    # session, so the generator owns its session
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(query.execution_options(yield_per=100))
+        async for row in result:
+            yield json_bytes(_portal_item(row)) + b"\n"
+
+
+async def _stream_portal_page(
+    query,
+    page: int,
+    page_size: int,
+    cursor_created_at: Optional[datetime],
+    cursor_id: Optional[int],
+    include_total: bool,
+):
+    """Yield a SymbolPortalResponse body in pieces, one item at a time."""
+    # StreamingResponse iterates in its own task, outside the request's scoped
+    # session, so the generator owns its session
+    async with AsyncSessionLocal() as db:
+        total, total_pages = await _count_pages(db, query, page_size, include_total)
+        
+        # One extra row tells whether another page follows, as in _paginate
+        result = await db.stream(
+            _seek_page(query, page, page_size, cursor_created_at, cursor_id)
+            .limit(page_size + 1)
+            .execution_options(yield_per=100)
         )
-        for s in symbols
-    ]
+        yield b'{"items":['
+        count = 0
+        last = None
+        has_more = False
+        async for row in result:
+            if count == page_size:
+                has_more = True
+                break
+            yield (b"," if count else b"") + json_bytes(_portal_item(row))
+            count += 1
+            last = row
+        await result.close()
+    
+    next_cursor = {"created_at": last.created_at, "id": last.id} if has_more else None
+    tail = json_bytes({
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages,
+        "next_cursor": next_cursor,
+    })
+    # Splice the remaining envelope fields in after the items array
+    yield b"]," + tail[1:]
+
+
+async def _query_portal(
+    page: int,
+    page_size: int,
+    distro: Optional[LinuxDistro],
+    ubuntu_version: Optional[UbuntuVersion],
+    debian_version: Optional[DebianVersion],
+    search: Optional[str],
+    cursor_created_at: Optional[datetime],
+    cursor_id: Optional[int],
+    include_total: bool,
+) -> dict:
+    """Run the /portal query (uncached); returns a SymbolPortalResponse-shaped dict."""
+    db = ScopedSession()
+    query = _portal_query(distro, ubuntu_version, debian_version, search)
+    
+    symbols, total, total_pages, next_cursor = await _paginate(
+        db, query, page, page_size, cursor_created_at, cursor_id, include_total
+    )
     
-    return SymbolPortalResponse(
-        items=items,
+    return dict(
+        items=[_portal_item(s) for s in symbols],
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=next_cursor
     )
 
 
+async def _increment_download_count(job_id: int):
+    """Atomically bump a job's download counter (runs after the response is sent)."""
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(SymbolGeneration)
+            .where(SymbolGeneration.id == job_id)
+            .values(download_count=SymbolGeneration.download_count + 1)
+        )
+        await db.commit()
+
+
 @router.get("/download/{job_id}")
-def download_symbol(
+async def download_symbol(
     job_id: int,
-    db: Session = Depends(get_db)
+    background_tasks: BackgroundTasks
 ):
     """
     Download a generated symbol file.
     
     This endpoint is public for the symbol portal.
     """
-    job = db.query(SymbolGeneration).filter(SymbolGeneration.id == job_id).first()
+    db = ScopedSession()
+    job = (await db.execute(
+        select(
+            SymbolGeneration.status,
+            SymbolGeneration.symbol_file_path,
+            SymbolGeneration.symbol_filename,
+        ).where(SymbolGeneration.id == job_id)
+    )).first()
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -563,26 +855,63 @@ def download_symbol(
             detail="Symbol file is not available"
         )
     
-    if not os.path.exists(job.symbol_file_path):
+    # Stat once here and hand the result to FileResponse so it doesn't stat again
+    try:
+        stat_result = os.stat(job.symbol_file_path)
+    except FileNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Symbol file not found on disk"
         )
     
-    # Increment download count
-    job.download_count += 1
-    db.commit()
+    # Count the download without holding the response on the commit
+    background_tasks.add_task(_increment_download_count, job_id)
     
-    return FileResponse(
+    return SymbolFileResponse(
         path=job.symbol_file_path,
         filename=job.symbol_filename,
-        media_type="application/x-xz"
+        media_type="application/x-xz",
+        stat_result=stat_result
     )
 
 
-@router.get("/distros")
-def get_supported_distros():
-    """Get list of supported Linux distributions and their versions."""
+def _get_distro_label(distro: LinuxDistro) -> str:
+    """Get human-readable distro label."""
+    labels = {
+        LinuxDistro.UBUNTU: "Ubuntu",
+        LinuxDistro.DEBIAN: "Debian",
+        LinuxDistro.FEDORA: "Fedora",
+        LinuxDistro.CENTOS: "CentOS",
+        LinuxDistro.RHEL: "Red Hat Enterprise Linux",
+        LinuxDistro.ORACLE: "Oracle Linux",
+        LinuxDistro.ROCKY: "Rocky Linux",
+        LinuxDistro.ALMA: "AlmaLinux",
+    }
+    return labels.get(distro, distro.value.capitalize())
+
+
+def _get_debian_codename(version: DebianVersion) -> str:
+    """Get Debian codename for display."""
+    codenames = {
+        DebianVersion.DEBIAN_10: "Buster",
+        DebianVersion.DEBIAN_11: "Bullseye",
+        DebianVersion.DEBIAN_12: "Bookworm",
+    }
+    return codenames.get(version, "")
+
+
+def _get_centos_label(version: CentOSVersion) -> str:
+    """Get CentOS version label."""
+    labels = {
+        CentOSVersion.CENTOS_7: "CentOS 7",
+        CentOSVersion.CENTOS_8: "CentOS Stream 8",
+        CentOSVersion.CENTOS_9: "CentOS Stream 9",
+    }
+    return labels.get(version, f"CentOS {version.value}")
+
+
+def _build_distros_payload() -> dict:
+    """Build the supported distributions payload (static for the process lifetime)."""
     return {
         "distros": [
             {"value": d.value, "label": _get_distro_label(d)}
@@ -623,50 +952,36 @@ def get_supported_distros():
     }
 
 
-def _get_distro_label(distro: LinuxDistro) -> str:
-    """Get human-readable distro label."""
-    labels = {
-        LinuxDistro.UBUNTU: "Ubuntu",
-        LinuxDistro.DEBIAN: "Debian",
-        LinuxDistro.FEDORA: "Fedora",
-        LinuxDistro.CENTOS: "CentOS",
-        LinuxDistro.RHEL: "Red Hat Enterprise Linux",
-        LinuxDistro.ORACLE: "Oracle Linux",
-        LinuxDistro.ROCKY: "Rocky Linux",
-        LinuxDistro.ALMA: "AlmaLinux",
-    }
-    return labels.get(distro, distro.value.capitalize())
+class _StaticJSON:
+    """Pre-serialized JSON body with a content-derived ETag."""
+    
+    def __init__(self, payload: dict):
+        self.body = orjson.dumps(payload)
+        self.etag = '"' + hashlib.sha256(self.body).hexdigest()[:16] + '"'
+    
+    def response(self, request: Request) -> Response:
+        headers = {"ETag": self.etag, "Cache-Control": _STATIC_CACHE_CONTROL}
+        if request.headers.get("if-none-match") == self.etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=self.body, media_type="application/json", headers=headers)
 
 
-def _get_debian_codename(version: DebianVersion) -> str:
-    """Get Debian codename for display."""
-    codenames = {
-        DebianVersion.DEBIAN_10: "Buster",
-        DebianVersion.DEBIAN_11: "Bullseye",
-        DebianVersion.DEBIAN_12: "Bookworm",
-    }
-    return codenames.get(version, "")
+_distros = _build_distros_payload()
+_DISTROS_PAYLOAD = _StaticJSON(_distros)
+_UBUNTU_VERSIONS_PAYLOAD = _StaticJSON({"versions": _distros["ubuntu_versions"]})
+del _distros
 
 
-def _get_centos_label(version: CentOSVersion) -> str:
-    """Get CentOS version label."""
-    labels = {
-        CentOSVersion.CENTOS_7: "CentOS 7",
-        CentOSVersion.CENTOS_8: "CentOS Stream 8",
-        CentOSVersion.CENTOS_9: "CentOS Stream 9",
-    }
-    return labels.get(version, f"CentOS {version.value}")
+@router.get("/distros")
+def get_supported_distros(request: Request):
+    """Get list of supported Linux distributions and their versions."""
+    return _DISTROS_PAYLOAD.response(request)
 
 
 @router.get("/ubuntu-versions")
-def get_supported_ubuntu_versions():
+def get_supported_ubuntu_versions(request: Request):
     """Get list of supported Ubuntu versions (legacy endpoint)."""
-    return {
-        "versions": [
-            {"value": v.value, "label": f"Ubuntu {v.value} LTS"}
-            for v in UbuntuVersion
-        ]
-    }
+    return _UBUNTU_VERSIONS_PAYLOAD.response(request)
 
 
 # ============================================================
@@ -1,8 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
-from typing import Optional, List
+from typing import List, Optional, Tuple
 from app.models import (
-    SymGenStatus, LinuxDistro,
+    SymGenStatus, LinuxDistro, DISTRO_VERSION_FIELDS,
     UbuntuVersion, DebianVersion, FedoraVersion, CentOSVersion,
     RHELVersion, OracleVersion, RockyVersion, AlmaVersion
 )
@@ -25,9 +25,26 @@ class SymGenCreate(BaseModel):
     rocky_version: Optional[RockyVersion] = None
     alma_version: Optional[AlmaVersion] = None
 
+    @property
+    def version_field(self) -> str:
+        """Name of the version field `distro` selects, e.g. "ubuntu_version"."""
+        return DISTRO_VERSION_FIELDS[self.distro][0]
+
+    @property
+    def selected_version(self):
+        """Value of the version field `distro` selects (None if not given)."""
+        return getattr(self, self.version_field)
+
+
+class JobBatchDelete(BaseModel):
+    """Request to delete several symbol generation jobs at once."""
+    job_ids: List[int] = Field(min_length=1, max_length=500)
+
 
 class SymGenResponse(BaseModel):
     """Response for a symbol generation job."""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: int
     kernel_version: str
     distro: LinuxDistro = LinuxDistro.UBUNTU
@@ -49,21 +66,27 @@ class SymGenResponse(BaseModel):
     completed_at: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+
+class PageCursor(BaseModel):
+    """Keyset cursor pointing at the last item of a page."""
+    created_at: datetime
+    id: int
 
 
 class SymGenListResponse(BaseModel):
     """Paginated response for symbol generation jobs."""
-    items: List[SymGenResponse]
-    total: int
+    items: Tuple[SymGenResponse, ...]
+    total: Optional[int] = None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[PageCursor] = None
 
 
 class GeneratedSymbolResponse(BaseModel):
     """Public symbol info for the symbol portal."""
+    model_config = ConfigDict(frozen=True)
+
     id: int
     kernel_version: str
     distro: LinuxDistro = LinuxDistro.UBUNTU
@@ -80,17 +103,15 @@ class GeneratedSymbolResponse(BaseModel):
     download_count: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class SymbolPortalResponse(BaseModel):
     """Paginated response for the public symbol portal."""
-    items: List[GeneratedSymbolResponse]
-    total: int
+    items: Tuple[GeneratedSymbolResponse, ...]
+    total: Optional[int] = None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[PageCursor] = None
 
 
 class KernelParseResponse(BaseModel):
@@ -111,6 +132,8 @@ class KernelParseResponse(BaseModel):
 
 class MetricsResponse(BaseModel):
     """System metrics response."""
+    model_config = ConfigDict(frozen=True)
+
     total_jobs: int
     completed_jobs: int
     failed_jobs: int
@@ -11,30 +11,67 @@ import re
 import asyncio
 import logging
 import shutil
-import glob as glob_module
 import threading
-import queue
+import codecs
+import io
+import functools
+import time
 from datetime import datetime
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
 import docker
-from docker.errors import ImageNotFound, ContainerError, APIError
+from docker.errors import ImageNotFound, ContainerError, APIError, BuildError, NotFound
+from sqlalchemy import case, delete, update
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models import (
-    SymbolGeneration, SymGenStatus, LinuxDistro,
+    SymbolGeneration, SymGenStatus, LinuxDistro, IN_PROGRESS_STATUSES, DISTRO_VERSION_FIELDS,
     UbuntuVersion, DebianVersion, FedoraVersion, CentOSVersion,
     RHELVersion, OracleVersion, RockyVersion, AlmaVersion
 )
+from app.cache import invalidate_sync as invalidate_cache
 from app.database import SessionLocal
-from app.websocket import manager as ws_manager
+from app.redis_client import redis_enabled
+from app.websocket import manager as ws_manager, serialize_job
+from app.worker import celery_enabled, revoke_generation
 
 logger = logging.getLogger(__name__)
 
 # Maximum concurrent jobs
 MAX_CONCURRENT_JOBS = 2
 
+# Docker client connection pool: each running job holds a log stream plus
+# short API calls, and the API process also checks/cancels containers
+DOCKER_POOL_SIZE = MAX_CONCURRENT_JOBS * 4
+# Minimum delay between reconnect attempts while Docker is unreachable
+DOCKER_RECONNECT_INTERVAL = 30.0
+
+# CPUs per generation container; xz compresses with this many threads
+# (~1 GiB each at -9, well inside the 8g memory limit)
+CONTAINER_CPUS = 2
+
+# Minimum seconds between progress-message writes within the same status
+# (status changes are always written immediately)
+STATUS_UPDATE_INTERVAL = 2.0
+
+# Threads for cleaning up the containers and files of deleted jobs
+CLEANUP_WORKERS = 8
+_cleanup_pool = ThreadPoolExecutor(max_workers=CLEANUP_WORKERS, thread_name_prefix="symgen-cleanup")
+# Deadline for stopping a job's container on cancel/delete. Removing a
+# container with a large writable layer can take a few seconds; past this
+# the caller moves on and dockerd finishes (or fails) in the background.
+CONTAINER_STOP_TIMEOUT = 10.0
+_stop_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="symgen-stop")
+# Single thread for the blocking Redis calls (cache revision bump, WebSocket
+# publish) made while on the event loop; one worker keeps updates in order
+_publish_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="symgen-publish")
+
+# Trailing container log lines kept for the job log and failure message
+LOG_TAIL_LINES = 500
+
 # Directory paths
 UPLOAD_DIR = os.getenv("UPLOAD_DIR", "/app/uploads")
 SYMBOLS_DIR = os.path.join(UPLOAD_DIR, "symbols")  # Centralized symbol storage
@@ -108,18 +145,73 @@ ALMA_IMAGES = {
     AlmaVersion.ALMA_9: "almalinux:9",
 }
 
+# Build images with the per-job tooling baked in (apt prerequisites and
+# dwarf2json), derived once from the base images above on first use.
+# Remove a symgen-tools/* image to have it rebuilt.
+DWARF2JSON_URL = "https://github.com/volatilityfoundation/dwarf2json/releases/download/v0.8.0/dwarf2json-linux-amd64"
+TOOLS_IMAGE_PREFIX = "symgen-tools/"
+TOOLS_PACKAGES = {
+    LinuxDistro.UBUNTU: "wget xz-utils ubuntu-dbgsym-keyring",
+    LinuxDistro.DEBIAN: "wget xz-utils ca-certificates",
+}
+TOOLS_DOCKERFILE = """FROM {base_image}
+ENV DEBIAN_FRONTEND=noninteractive
+RUN apt-get update -qq && apt-get install -y -qq {packages} && rm -rf /var/lib/apt/lists/*
+RUN wget -q {dwarf2json_url} -O /usr/local/bin/dwarf2json && chmod +x /usr/local/bin/dwarf2json
+"""
+
+# Base images per distro, for preloading
+DISTRO_IMAGES = {
+    LinuxDistro.UBUNTU: UBUNTU_IMAGES,
+    LinuxDistro.DEBIAN: DEBIAN_IMAGES,
+    LinuxDistro.FEDORA: FEDORA_IMAGES,
+    LinuxDistro.CENTOS: CENTOS_IMAGES,
+    LinuxDistro.RHEL: RHEL_IMAGES,
+    LinuxDistro.ORACLE: ORACLE_IMAGES,
+    LinuxDistro.ROCKY: ROCKY_IMAGES,
+    LinuxDistro.ALMA: ALMA_IMAGES,
+}
+
+# Distros whose images are pulled (and tools images built) at startup rather
+# than on their first job: comma-separated distro names, or "all"
+PRELOAD_IMAGES = os.getenv("SYMGEN_PRELOAD_IMAGES", "")
+_preload_names = {name.strip().lower() for name in PRELOAD_IMAGES.split(",") if name.strip()}
+PRELOAD_DISTROS = [d for d in LinuxDistro if "all" in _preload_names or d.value in _preload_names]
+
+
+def _publish(fn, *args):
+    """
+    Run a Redis-backed cache/WebSocket call without blocking the event loop.
+    
+    On the loop with Redis configured, the call is handed to _publish_pool.
+    Otherwise it runs inline; without Redis it only touches local state (and
+    local WebSocket sends must be scheduled from the loop thread).
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        fn(*args)
+        return
+    if redis_enabled():
+        _publish_pool.submit(fn, *args)
+    else:
+        fn(*args)
+
 
 class JobQueue:
     """
     Manages a queue of symbol generation jobs with limited concurrency.
     Only MAX_CONCURRENT_JOBS jobs run at a time, others wait in queue.
+    
+    State is only touched from the event loop (cancellation goes through
+    SymbolGenerator.cancel_job_async) and no update spans an await, so the
+    queue needs no lock.
     """
     
     def __init__(self, max_concurrent: int = MAX_CONCURRENT_JOBS):
         self.max_concurrent = max_concurrent
         self._running_jobs: Dict[int, asyncio.Task] = {}  # job_id -> task
         self._pending_queue: deque = deque()  # Queue of (job_id, args, kwargs)
-        self._lock = asyncio.Lock()
         self._generator = None  # Will be set by SymbolGenerator
         logger.info(f"JobQueue initialized with max_concurrent={max_concurrent}")
     
@@ -153,20 +245,19 @@ class JobQueue:
         Submit a job to the queue.
         Returns True if job started immediately, False if queued.
         """
-        async with self._lock:
-            if self.running_count < self.max_concurrent:
-                # Start immediately
-                await self._start_job(job_id, args, kwargs)
-                return True
-            else:
-                # Add to queue
-                self._pending_queue.append((job_id, args, kwargs))
-                queue_pos = len(self._pending_queue)
-                logger.info(f"Job {job_id} queued at position {queue_pos}")
-                
-                # Update job status to show queue position
-                self._update_queued_status(job_id, queue_pos)
-                return False
+        if self.running_count < self.max_concurrent:
+            # Start immediately
+            self._start_job(job_id, args, kwargs)
+            return True
+        else:
+            # Add to queue
+            self._pending_queue.append((job_id, args, kwargs))
+            queue_pos = len(self._pending_queue)
+            logger.info(f"Job {job_id} queued at position {queue_pos}")
+            
+            # Update job status to show queue position
+            self._update_queued_status(job_id, queue_pos)
+            return False
     
     def _update_queued_status(self, job_id: int, position: int):
         """Update job status to show it's queued."""
@@ -176,10 +267,33 @@ class JobQueue:
             if job:
                 job.status_message = f"Queued (position {position} of {self.queued_count})"
                 db.commit()
+                _publish(invalidate_cache)
+        finally:
+            db.close()
+    
+    def _update_queue_positions(self):
+        """Rewrite the queue position of every waiting job in a single UPDATE."""
+        if not self._pending_queue:
+            return
+        total = len(self._pending_queue)
+        messages = {
+            queued_id: f"Queued (position {i} of {total})"
+            for i, (queued_id, _, _) in enumerate(self._pending_queue, 1)
+        }
+        db = SessionLocal()
+        try:
+            db.execute(
+                update(SymbolGeneration)
+                .where(SymbolGeneration.id.in_(messages))
+                .values(status_message=case(messages, value=SymbolGeneration.id))
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
         finally:
             db.close()
+        _publish(invalidate_cache)
     
-    async def _start_job(self, job_id: int, args: tuple, kwargs: dict):
+    def _start_job(self, job_id: int, args: tuple, kwargs: dict):
         """Start a job and track it."""
         if not self._generator:
             logger.error("Generator not set on JobQueue")
@@ -203,47 +317,43 @@ class JobQueue:
     
     async def _on_job_complete(self, job_id: int):
         """Handle job completion - remove from running and start next queued job."""
-        async with self._lock:
-            # Remove from running
-            if job_id in self._running_jobs:
-                del self._running_jobs[job_id]
+        # Remove from running
+        if job_id in self._running_jobs:
+            del self._running_jobs[job_id]
+        
+        logger.info(f"Job {job_id} completed. Running: {self.running_count}, Queued: {self.queued_count}")
+        
+        # Start next queued job if any
+        if self._pending_queue and self.running_count < self.max_concurrent:
+            next_job_id, next_args, next_kwargs = self._pending_queue.popleft()
+            logger.info(f"Starting queued job {next_job_id}")
             
-            logger.info(f"Job {job_id} completed. Running: {self.running_count}, Queued: {self.queued_count}")
+            # Update queue positions for remaining jobs
+            self._update_queue_positions()
             
-            # Start next queued job if any
-            if self._pending_queue and self.running_count < self.max_concurrent:
-                next_job_id, next_args, next_kwargs = self._pending_queue.popleft()
-                logger.info(f"Starting queued job {next_job_id}")
-                
-                # Update queue positions for remaining jobs
-                for i, (queued_id, _, _) in enumerate(self._pending_queue):
-                    self._update_queued_status(queued_id, i + 1)
-                
-                await self._start_job(next_job_id, next_args, next_kwargs)
+            self._start_job(next_job_id, next_args, next_kwargs)
     
     async def cancel_job(self, job_id: int) -> bool:
         """Cancel a job (running or queued)."""
-        async with self._lock:
-            # Check if running
-            if job_id in self._running_jobs:
-                task = self._running_jobs[job_id]
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
+        # Check if running
+        if job_id in self._running_jobs:
+            task = self._running_jobs[job_id]
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            return True
+        
+        # Check if queued
+        for i, (queued_id, _, _) in enumerate(self._pending_queue):
+            if queued_id == job_id:
+                del self._pending_queue[i]
+                # Update positions for remaining jobs
+                self._update_queue_positions()
                 return True
-            
-            # Check if queued
-            for i, (queued_id, _, _) in enumerate(self._pending_queue):
-                if queued_id == job_id:
-                    del self._pending_queue[i]
-                    # Update positions for remaining jobs
-                    for j, (qid, _, _) in enumerate(self._pending_queue):
-                        self._update_queued_status(qid, j + 1)
-                    return True
-            
-            return False
+        
+        return False
 
 
 # Global job queue instance
@@ -255,6 +365,78 @@ def ensure_directories():
     os.makedirs(SYMBOLS_DIR, exist_ok=True)
 
 
+# Kernel version patterns used by parse_kernel_version, compiled once
+_DEBIAN_KVER_RE = re.compile(r'Linux version (\d+\.\d+\.\d+-\d+-amd64)')
+_DEBIAN_KVER_FALLBACK_RE = re.compile(r'(\d+\.\d+\.\d+-\d+-amd64)')
+_UBUNTU_KVER_RE = re.compile(r'Linux version (\d+\.\d+\.\d+-\d+-[a-z]+)')
+_UBUNTU_KVER_FALLBACK_RE = re.compile(r'(\d+\.\d+\.\d+-\d+-generic)')
+_FEDORA_KVER_RE = re.compile(r'Linux version (\d+\.\d+\.\d+-\d+\.fc\d+\.[a-z0-9_]+)')
+_FEDORA_KVER_FALLBACK_RE = re.compile(r'(\d+\.\d+\.\d+-\d+\.fc\d+\.[a-z0-9_]+)')
+_EL_KVER_RE = re.compile(r'Linux version (\d+\.\d+\.\d+-[\d.]+\.el\d+[a-z0-9_.]*)')
+_EL_KVER_FALLBACK_RE = re.compile(r'(\d+\.\d+\.\d+-[\d.]+\.el\d+[a-z0-9_.]*)')
+_UEK_KVER_RE = re.compile(r'(\d+\.\d+\.\d+-[\d.]+\.el\d+uek[a-z0-9_.]*)')
+_GENERIC_KVER_RE = re.compile(r'Linux version (\d+\.\d+\.\d+[^\s]*)')
+_GENERIC_KVER_FALLBACK_RE = re.compile(r'(\d+\.\d+\.\d+-\d+-[a-z]+)')
+_FC_RELEASE_RE = re.compile(r'\.fc(\d+)\.')
+_EL_RELEASE_RE = re.compile(r'\.el(\d+)')
+
+# Release tags found in banners, matched in one pass over the lowercased
+# banner. Dict order is precedence when a banner carries several tags.
+_DEBIAN_TAGS = {
+    DebianVersion.DEBIAN_10: ("buster", "debian 10"),
+    DebianVersion.DEBIAN_11: ("bullseye", "debian 11"),
+    DebianVersion.DEBIAN_12: ("bookworm", "debian 12"),
+}
+_UBUNTU_TAGS = {
+    UbuntuVersion.UBUNTU_22_04: ("~22.04", "jammy"),
+    UbuntuVersion.UBUNTU_20_04: ("~20.04", "focal"),
+    UbuntuVersion.UBUNTU_24_04: ("~24.04", "noble"),
+}
+
+
+def _tag_pattern(tags: dict) -> re.Pattern:
+    """Compile an alternation matching every tag in a _*_TAGS table."""
+    return re.compile("|".join(re.escape(tag) for group in tags.values() for tag in group))
+
+
+_DEBIAN_TAG_RE = _tag_pattern(_DEBIAN_TAGS)
+_UBUNTU_TAG_RE = _tag_pattern(_UBUNTU_TAGS)
+
+# Version field, release tag pattern and {release number: version} for the
+# distros versioned by their .fcNN / .elN kernel release tag
+_RELEASE_VERSIONS = {
+    distro: (field, _FC_RELEASE_RE if distro == LinuxDistro.FEDORA else _EL_RELEASE_RE,
+             {v.value: v for v in enum_cls})
+    for distro, (field, enum_cls) in DISTRO_VERSION_FIELDS.items()
+    if distro not in (LinuxDistro.UBUNTU, LinuxDistro.DEBIAN)
+}
+
+# Filename prefix, codename table (None to use the version number) and
+# position of the version argument in get_symbol_filename, per distro
+_FILENAME_SPECS = {
+    LinuxDistro.UBUNTU: ("Ubuntu", UBUNTU_CODENAMES, 0),
+    LinuxDistro.DEBIAN: ("Debian", DEBIAN_CODENAMES, 1),
+    LinuxDistro.FEDORA: ("Fedora", None, 2),
+    LinuxDistro.CENTOS: ("CentOS", None, 3),
+    LinuxDistro.RHEL: ("RHEL", None, 4),
+    LinuxDistro.ORACLE: ("Oracle", None, 5),
+    LinuxDistro.ROCKY: ("Rocky", None, 6),
+    LinuxDistro.ALMA: ("Alma", None, 7),
+}
+
+
+def _tagged_release(pattern: re.Pattern, tags: dict, banner_lower: str):
+    """Return the highest-precedence release whose tag appears in the banner."""
+    found = set(pattern.findall(banner_lower))
+    if not found:
+        return None
+    for version, group in tags.items():
+        if not found.isdisjoint(group):
+            return version
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
 def parse_kernel_version(banner: str) -> Optional[dict]:
     """
     Parse kernel version and distro from kernel banner.
@@ -275,6 +457,9 @@ def parse_kernel_version(banner: str) -> Optional[dict]:
     "Linux version 4.18.0-513.el8.x86_64 (mockbuild@...) 
      (gcc (GCC) 8.5.0 20210514 (Red Hat 8.5.0-18)..."
     
+    Results are memoized per banner, so the returned dict is shared between
+    callers and must not be mutated.
+    
     Returns:
         Dict with kernel_version, distro, and version fields, or None
     """
@@ -298,32 +483,32 @@ def parse_kernel_version(banner: str) -> Optional[dict]:
     
     if is_debian:
         # Debian pattern: 5.10.0-28-amd64, 6.1.0-18-amd64
-        kernel_match = re.search(r'Linux version (\d+\.\d+\.\d+-\d+-amd64)', banner)
+        kernel_match = _DEBIAN_KVER_RE.search(banner)
         if not kernel_match:
-            kernel_match = re.search(r'(\d+\.\d+\.\d+-\d+-amd64)', banner)
+            kernel_match = _DEBIAN_KVER_FALLBACK_RE.search(banner)
     elif is_ubuntu:
         # Ubuntu pattern: 5.15.0-91-generic
-        kernel_match = re.search(r'Linux version (\d+\.\d+\.\d+-\d+-[a-z]+)', banner)
+        kernel_match = _UBUNTU_KVER_RE.search(banner)
         if not kernel_match:
-            kernel_match = re.search(r'(\d+\.\d+\.\d+-\d+-generic)', banner)
+            kernel_match = _UBUNTU_KVER_FALLBACK_RE.search(banner)
     elif is_fedora:
         # Fedora pattern: 6.5.6-300.fc39.x86_64
-        kernel_match = re.search(r'Linux version (\d+\.\d+\.\d+-\d+\.fc\d+\.[a-z0-9_]+)', banner)
+        kernel_match = _FEDORA_KVER_RE.search(banner)
         if not kernel_match:
-            kernel_match = re.search(r'(\d+\.\d+\.\d+-\d+\.fc\d+\.[a-z0-9_]+)', banner)
+            kernel_match = _FEDORA_KVER_FALLBACK_RE.search(banner)
     elif is_rhel or is_centos or is_rocky or is_alma or is_oracle:
         # RHEL-based pattern: 4.18.0-513.el8.x86_64, 5.14.0-362.el9.x86_64
-        kernel_match = re.search(r'Linux version (\d+\.\d+\.\d+-[\d.]+\.el\d+[a-z0-9_.]*)', banner)
+        kernel_match = _EL_KVER_RE.search(banner)
         if not kernel_match:
-            kernel_match = re.search(r'(\d+\.\d+\.\d+-[\d.]+\.el\d+[a-z0-9_.]*)', banner)
+            kernel_match = _EL_KVER_FALLBACK_RE.search(banner)
         if not kernel_match:
             # Oracle Linux pattern: 5.15.0-100.96.32.el8uek.x86_64
-            kernel_match = re.search(r'(\d+\.\d+\.\d+-[\d.]+\.el\d+uek[a-z0-9_.]*)', banner)
+            kernel_match = _UEK_KVER_RE.search(banner)
     else:
         # Generic pattern
-        kernel_match = re.search(r'Linux version (\d+\.\d+\.\d+[^\s]*)', banner)
+        kernel_match = _GENERIC_KVER_RE.search(banner)
         if not kernel_match:
-            kernel_match = re.search(r'(\d+\.\d+\.\d+-\d+-[a-z]+)', banner)
+            kernel_match = _GENERIC_KVER_FALLBACK_RE.search(banner)
     
     if not kernel_match:
         return None
@@ -348,12 +533,9 @@ def parse_kernel_version(banner: str) -> Optional[dict]:
     if is_debian:
         result["distro"] = LinuxDistro.DEBIAN
         
-        if "buster" in banner_lower or "debian 10" in banner_lower:
-            result["debian_version"] = DebianVersion.DEBIAN_10
-        elif "bullseye" in banner_lower or "debian 11" in banner_lower:
-            result["debian_version"] = DebianVersion.DEBIAN_11
-        elif "bookworm" in banner_lower or "debian 12" in banner_lower:
-            result["debian_version"] = DebianVersion.DEBIAN_12
+        tagged = _tagged_release(_DEBIAN_TAG_RE, _DEBIAN_TAGS, banner_lower)
+        if tagged:
+            result["debian_version"] = tagged
         else:
             major_minor = kernel_version.split('-')[0]
             if major_minor.startswith("4.19."):
@@ -366,12 +548,9 @@ def parse_kernel_version(banner: str) -> Optional[dict]:
     elif is_ubuntu:
         result["distro"] = LinuxDistro.UBUNTU
         
-        if "~22.04" in banner or "jammy" in banner_lower:
-            result["ubuntu_version"] = UbuntuVersion.UBUNTU_22_04
-        elif "~20.04" in banner or "focal" in banner_lower:
-            result["ubuntu_version"] = UbuntuVersion.UBUNTU_20_04
-        elif "~24.04" in banner or "noble" in banner_lower:
-            result["ubuntu_version"] = UbuntuVersion.UBUNTU_24_04
+        tagged = _tagged_release(_UBUNTU_TAG_RE, _UBUNTU_TAGS, banner_lower)
+        if tagged:
+            result["ubuntu_version"] = tagged
         else:
             major_minor = kernel_version.split('-')[0]
             if major_minor.startswith("5.4."):
@@ -383,75 +562,25 @@ def parse_kernel_version(banner: str) -> Optional[dict]:
                 
     elif is_fedora:
         result["distro"] = LinuxDistro.FEDORA
-        
-        # Extract Fedora version from kernel (e.g., fc39 -> 39)
-        fc_match = re.search(r'\.fc(\d+)\.', kernel_version)
-        if fc_match:
-            fc_ver = fc_match.group(1)
-            if fc_ver == "38":
-                result["fedora_version"] = FedoraVersion.FEDORA_38
-            elif fc_ver == "39":
-                result["fedora_version"] = FedoraVersion.FEDORA_39
-            elif fc_ver == "40":
-                result["fedora_version"] = FedoraVersion.FEDORA_40
-                
     elif is_centos:
         result["distro"] = LinuxDistro.CENTOS
-        
-        el_match = re.search(r'\.el(\d+)', kernel_version)
-        if el_match:
-            el_ver = el_match.group(1)
-            if el_ver == "7":
-                result["centos_version"] = CentOSVersion.CENTOS_7
-            elif el_ver == "8":
-                result["centos_version"] = CentOSVersion.CENTOS_8
-            elif el_ver == "9":
-                result["centos_version"] = CentOSVersion.CENTOS_9
-                
     elif is_rocky:
         result["distro"] = LinuxDistro.ROCKY
-        
-        el_match = re.search(r'\.el(\d+)', kernel_version)
-        if el_match:
-            el_ver = el_match.group(1)
-            if el_ver == "8":
-                result["rocky_version"] = RockyVersion.ROCKY_8
-            elif el_ver == "9":
-                result["rocky_version"] = RockyVersion.ROCKY_9
-                
     elif is_alma:
         result["distro"] = LinuxDistro.ALMA
-        
-        el_match = re.search(r'\.el(\d+)', kernel_version)
-        if el_match:
-            el_ver = el_match.group(1)
-            if el_ver == "8":
-                result["alma_version"] = AlmaVersion.ALMA_8
-            elif el_ver == "9":
-                result["alma_version"] = AlmaVersion.ALMA_9
-                
     elif is_oracle:
         result["distro"] = LinuxDistro.ORACLE
-        
-        el_match = re.search(r'\.el(\d+)', kernel_version)
-        if el_match:
-            el_ver = el_match.group(1)
-            if el_ver == "8":
-                result["oracle_version"] = OracleVersion.ORACLE_8
-            elif el_ver == "9":
-                result["oracle_version"] = OracleVersion.ORACLE_9
-                
     elif is_rhel:
         result["distro"] = LinuxDistro.RHEL
-        
-        el_match = re.search(r'\.el(\d+)', kernel_version)
-        if el_match:
-            el_ver = el_match.group(1)
-            if el_ver == "8":
-                result["rhel_version"] = RHELVersion.RHEL_8
-            elif el_ver == "9":
-                result["rhel_version"] = RHELVersion.RHEL_9
-                
+    
+    # Fedora and EL releases come from the .fcNN / .elN tag (e.g., fc39 -> 39)
+    release = _RELEASE_VERSIONS.get(result["distro"])
+    if release:
+        field, pattern, versions = release
+        release_match = pattern.search(kernel_version)
+        if release_match:
+            result[field] = versions.get(release_match.group(1))
+    
     return result
 
 
@@ -468,27 +597,18 @@ def get_symbol_filename(
     alma_version: Optional[AlmaVersion] = None,
 ) -> str:
     """Generate symbol filename."""
-    if distro == LinuxDistro.DEBIAN and debian_version:
-        codename = DEBIAN_CODENAMES[debian_version]
-        return f"Debian_{codename}_{kernel_version}.json.xz"
-    elif distro == LinuxDistro.UBUNTU and ubuntu_version:
-        codename = UBUNTU_CODENAMES[ubuntu_version]
-        return f"Ubuntu_{codename}_{kernel_version}.json.xz"
-    elif distro == LinuxDistro.FEDORA and fedora_version:
-        return f"Fedora_{fedora_version.value}_{kernel_version}.json.xz"
-    elif distro == LinuxDistro.CENTOS and centos_version:
-        return f"CentOS_{centos_version.value}_{kernel_version}.json.xz"
-    elif distro == LinuxDistro.RHEL and rhel_version:
-        return f"RHEL_{rhel_version.value}_{kernel_version}.json.xz"
-    elif distro == LinuxDistro.ORACLE and oracle_version:
-        return f"Oracle_{oracle_version.value}_{kernel_version}.json.xz"
-    elif distro == LinuxDistro.ROCKY and rocky_version:
-        return f"Rocky_{rocky_version.value}_{kernel_version}.json.xz"
-    elif distro == LinuxDistro.ALMA and alma_version:
-        return f"Alma_{alma_version.value}_{kernel_version}.json.xz"
-    else:
-        # Fallback
-        return f"Linux_{kernel_version}.json.xz"
+    spec = _FILENAME_SPECS.get(distro)
+    if spec:
+        prefix, codenames, index = spec
+        version = (
+            ubuntu_version, debian_version, fedora_version, centos_version,
+            rhel_version, oracle_version, rocky_version, alma_version
+        )[index]
+        if version:
+            label = codenames[version] if codenames else version.value
+            return f"{prefix}_{label}_{kernel_version}.json.xz"
+    # Fallback
+    return f"Linux_{kernel_version}.json.xz"
 
 
 def check_existing_symbol(
@@ -518,19 +638,37 @@ def check_existing_symbol(
     return None
 
 
+# Progress markers in the container script output. The scripts echo them at
+# the start of a line, so only lines with a marker prefix are checked.
+_STATUS_MARKERS = {
+    ">>> Updating package lists": (SymGenStatus.DOWNLOADING_KERNEL, "Updating package lists..."),
+    ">>> Installing required packages": (SymGenStatus.DOWNLOADING_KERNEL, "Installing required packages..."),
+    ">>> Adding ddebs repository": (SymGenStatus.DOWNLOADING_KERNEL, "Adding debug symbol repository..."),
+    ">>> Installing kernel debug symbols": (SymGenStatus.DOWNLOADING_KERNEL, "Downloading kernel debug symbols (this may take a while)..."),
+    ">>> Looking for vmlinux": (SymGenStatus.GENERATING_SYMBOL, "Locating kernel debug information..."),
+    ">>> Found vmlinux": (SymGenStatus.GENERATING_SYMBOL, "Found kernel debug symbols..."),
+    ">>> Setting up dwarf2json": (SymGenStatus.GENERATING_SYMBOL, "Setting up symbol generator..."),
+    ">>> Generating Volatility3 symbol file": (SymGenStatus.GENERATING_SYMBOL, "Generating symbol file (this may take a while)..."),
+    "=== Symbol generation completed": (SymGenStatus.GENERATING_SYMBOL, "Symbol generation completed, finalizing..."),
+}
+_MARKER_PREFIXES = (">>> ", "=== ")
+
+
 class SymbolGenerator:
     """Handles Docker-based symbol generation with job queue."""
     
     def __init__(self):
         self.docker_client = None
+        self._last_connect_attempt = 0.0
         self._connect_docker()
         # Register with job queue
         job_queue.set_generator(self)
     
     def _connect_docker(self):
-        """Connect to Docker daemon."""
+        """Connect to Docker daemon (one client and connection pool for all jobs)."""
+        self._last_connect_attempt = time.monotonic()
         try:
-            self.docker_client = docker.from_env()
+            self.docker_client = docker.from_env(max_pool_size=DOCKER_POOL_SIZE)
             self.docker_client.ping()
             logger.info("Connected to Docker daemon")
         except Exception as e:
@@ -538,11 +676,45 @@ class SymbolGenerator:
             self.docker_client = None
     
     def is_available(self) -> bool:
-        """Check if Docker is available."""
-        if not self.docker_client:
+        """Check if Docker is available, retrying the connection at most every DOCKER_RECONNECT_INTERVAL."""
+        if (
+            not self.docker_client
+            and time.monotonic() - self._last_connect_attempt >= DOCKER_RECONNECT_INTERVAL
+        ):
             self._connect_docker()
         return self.docker_client is not None
     
+    def close(self):
+        """Release the Docker client's connection pool (called on shutdown)."""
+        if self.docker_client is not None:
+            self.docker_client.close()
+            self.docker_client = None
+    
+    def start_preload(self):
+        """Preload PRELOAD_DISTROS images in a background thread (no-op when unset)."""
+        if PRELOAD_DISTROS:
+            threading.Thread(target=self._preload_images, name="symgen-preload", daemon=True).start()
+    
+    def _preload_images(self):
+        """Pull missing base images and build missing tools images, one at a time."""
+        if not self.is_available():
+            logger.warning("Docker unavailable, skipping image preload")
+            return
+        for distro in PRELOAD_DISTROS:
+            for image in dict.fromkeys(DISTRO_IMAGES[distro].values()):
+                tools_image = TOOLS_IMAGE_PREFIX + image if distro in TOOLS_PACKAGES else None
+                try:
+                    if tools_image and self._has_amd64_image(tools_image):
+                        continue
+                    if not self._has_amd64_image(image):
+                        logger.info(f"Preloading image {image}...")
+                        self.docker_client.images.pull(image, platform="linux/amd64")
+                    if tools_image:
+                        self._build_tools_image(image, tools_image, distro)
+                except Exception as e:
+                    logger.warning(f"Failed to preload {image}: {e}")
+        logger.info("Image preload finished")
+    
     def get_queue_status(self) -> Dict[str, int]:
         """Get current queue status."""
         return {
@@ -556,158 +728,202 @@ class SymbolGenerator:
         status_value = job.status.value if job.status else None
         logger.info(f"[SymGen] Job {job.id} status updated: {status_value}")
         
-        # Broadcast via WebSocket for live updates
-        ws_manager.broadcast_sync({
-            "type": "job_update",
-            "job": {
-                "id": job.id,
-                "kernel_version": job.kernel_version,
-                "distro": job.distro.value if job.distro else None,
-                "ubuntu_version": job.ubuntu_version.value if job.ubuntu_version else None,
-                "debian_version": job.debian_version.value if job.debian_version else None,
-                "fedora_version": job.fedora_version.value if job.fedora_version else None,
-                "centos_version": job.centos_version.value if job.centos_version else None,
-                "rhel_version": job.rhel_version.value if job.rhel_version else None,
-                "oracle_version": job.oracle_version.value if job.oracle_version else None,
-                "rocky_version": job.rocky_version.value if job.rocky_version else None,
-                "alma_version": job.alma_version.value if job.alma_version else None,
-                "status": status_value,
-                "status_message": job.status_message,
-                "error_message": job.error_message,
-                "symbol_filename": job.symbol_filename,
-                "symbol_file_size": job.symbol_file_size,
-                "download_count": job.download_count,
-                "started_at": job.started_at.isoformat() if job.started_at else None,
-                "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-                "created_at": job.created_at.isoformat() if job.created_at else None,
-            }
-        }, channel="symgen")
+        # Drop cached job lists, then broadcast via WebSocket for live updates.
+        # The job is serialized here, while its session is still in use.
+        message = {"type": "job_update", "job": serialize_job(job)}
+        _publish(self._publish_job_update, message)
     
-    def _update_status(self, db: Session, job_id: int, status: SymGenStatus, 
-                       message: str = None, error: str = None):
-        """Update job status in database."""
-        job = db.query(SymbolGeneration).filter(SymbolGeneration.id == job_id).first()
-        if job:
-            job.status = status
-            if message:
-                job.status_message = message
-            if error:
-                job.error_message = error
-            if status == SymGenStatus.RUNNING and not job.started_at:
-                job.started_at = datetime.utcnow()
-            if status in (SymGenStatus.COMPLETED, SymGenStatus.FAILED):
-                job.completed_at = datetime.utcnow()
-            db.commit()
-            
-            # Log status update
-            self._broadcast_job_update(job)
+    def _publish_job_update(self, message: dict):
+        """Invalidate cached job lists and send a job_update message."""
+        invalidate_cache()
+        ws_manager.broadcast_sync(message, channel="symgen")
+    
+    def _has_amd64_image(self, image: str) -> bool:
+        """Check whether an amd64 build of `image` is available locally."""
+        try:
+            local_image = self.docker_client.images.get(image)
+        except ImageNotFound:
+            return False
+        if local_image.attrs.get("Architecture", "amd64") != "amd64":
+            logger.info(f"Image {image} found locally (wrong architecture)")
+            return False
+        logger.info(f"Image {image} found locally")
+        return True
+    
+    def _build_tools_image(self, base_image: str, tag: str, distro: LinuxDistro) -> str:
+        """Build `tag` from base_image with TOOLS_PACKAGES and dwarf2json; falls back to base_image."""
+        dockerfile = TOOLS_DOCKERFILE.format(
+            base_image=base_image,
+            packages=TOOLS_PACKAGES[distro],
+            dwarf2json_url=DWARF2JSON_URL,
+        )
+        logger.info(f"Building {tag} from {base_image}...")
+        try:
+            self.docker_client.images.build(
+                fileobj=io.BytesIO(dockerfile.encode("utf-8")),
+                tag=tag,
+                platform="linux/amd64",
+                rm=True,
+            )
+        except (BuildError, APIError) as e:
+            logger.warning(f"Failed to build {tag}, using {base_image}: {e}")
+            return base_image
+        return tag
+    
+    async def _update_status(self, db: Session, job_id: int, status: SymGenStatus, 
+                             message: str = None, error: str = None, **fields) -> bool:
+        """
+        Update job status (plus any extra column `fields`) in database.
+        
+        Only jobs still in progress are written, so a job cancelled or deleted
+        meanwhile keeps its final state. Returns whether the job was updated.
+        """
+        # The commit blocks on the database, so it runs in a thread; only the
+        # broadcast is scheduled from the event loop
+        job = await asyncio.to_thread(
+            self._write_status, db, job_id, status, message, error, fields
+        )
+        if job is None:
+            return False
+        
+        # Log status update
+        self._broadcast_job_update(job)
+        return True
     
-    async def _monitor_container(self, db: Session, job_id: int, container) -> int:
+    def _write_status(self, db: Session, job_id: int, status: SymGenStatus,
+                      message: Optional[str], error: Optional[str],
+                      fields: Dict[str, Any]) -> Optional[SymbolGeneration]:
+        """Commit a status update for _update_status; returns the job, or None if skipped."""
+        # Served from the session's identity map after the first load, so a
+        # transition costs a single UPDATE rather than SELECT + UPDATE
+        job = db.get(SymbolGeneration, job_id)
+        if not job:
+            return None
+        values = dict(fields, status=status)
+        if message:
+            values["status_message"] = message
+        if error:
+            values["error_message"] = error
+        if status == SymGenStatus.RUNNING and not job.started_at:
+            values["started_at"] = datetime.utcnow()
+        if status in (SymGenStatus.COMPLETED, SymGenStatus.FAILED):
+            values["completed_at"] = datetime.utcnow()
+        result = db.execute(
+            update(SymbolGeneration)
+            .where(
+                SymbolGeneration.id == job_id,
+                SymbolGeneration.status.in_(IN_PROGRESS_STATUSES),
+            )
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        if not result.rowcount:
+            logger.info(f"Job {job_id} was cancelled or deleted, skipping status update")
+            return None
+        for name, value in values.items():
+            set_committed_value(job, name, value)
+        return job
+    
+    async def _monitor_container(self, db: Session, job_id: int, container) -> Tuple[int, str]:
         """
         Monitor container logs and update status based on progress markers.
-        Returns the container exit code.
+        Returns the container exit code and the last LOG_TAIL_LINES log lines.
         """
         current_status = SymGenStatus.DOWNLOADING_KERNEL
         last_message = ""
+        tail = deque(maxlen=LOG_TAIL_LINES)
+        # Status/message last written to the job, and a coalesced one not yet written
+        saved_status = current_status
+        last_saved_at = time.monotonic()
+        pending = None
         
-        # Progress markers in the container script output
-        status_markers = {
-            ">>> Updating package lists": (SymGenStatus.DOWNLOADING_KERNEL, "Updating package lists..."),
-            ">>> Installing required packages": (SymGenStatus.DOWNLOADING_KERNEL, "Installing required packages..."),
-            ">>> Adding ddebs repository": (SymGenStatus.DOWNLOADING_KERNEL, "Adding debug symbol repository..."),
-            ">>> Installing kernel debug symbols": (SymGenStatus.DOWNLOADING_KERNEL, "Downloading kernel debug symbols (this may take a while)..."),
-            ">>> Looking for vmlinux": (SymGenStatus.GENERATING_SYMBOL, "Locating kernel debug information..."),
-            ">>> Found vmlinux": (SymGenStatus.GENERATING_SYMBOL, "Found kernel debug symbols..."),
-            ">>> Setting up dwarf2json": (SymGenStatus.GENERATING_SYMBOL, "Setting up symbol generator..."),
-            ">>> Generating Volatility3 symbol file": (SymGenStatus.GENERATING_SYMBOL, "Generating symbol file (this may take a while)..."),
-            ">>> Compressing symbol file": (SymGenStatus.GENERATING_SYMBOL, "Compressing symbol file..."),
-            "=== Symbol generation completed": (SymGenStatus.GENERATING_SYMBOL, "Symbol generation completed, finalizing..."),
-        }
+        async def save(status: SymGenStatus, message: str):
+            nonlocal saved_status, last_saved_at, pending
+            await self._update_status(db, job_id, status, message=message)
+            saved_status = status
+            last_saved_at = time.monotonic()
+            pending = None
         
-        try:
-            # Stream logs with a timeout
-            log_stream = container.logs(stream=True, follow=True)
-            buffer = ""
+        async def handle_line(line: str):
+            nonlocal current_status, last_message, pending
+            # Check for errors; everything else without a marker prefix is build noise
+            if not line.startswith(_MARKER_PREFIXES):
+                if line.startswith("ERROR:"):
+                    logger.warning(f"[Job {job_id}] Container error: {line}")
+                return
             
-            # Use a thread to read logs since it's blocking
-            log_queue = queue.Queue()
-            stop_event = threading.Event()
+            # Check for progress markers
+            for marker, (new_status, message) in _STATUS_MARKERS.items():
+                if line.startswith(marker):
+                    if new_status != current_status or message != last_message:
+                        current_status = new_status
+                        last_message = message
+                        logger.info(f"[Job {job_id}] Status: {new_status.value} - {message}")
+                        if (new_status != saved_status
+                                or time.monotonic() - last_saved_at >= STATUS_UPDATE_INTERVAL):
+                            await save(new_status, message)
+                        else:
+                            pending = (new_status, message)
+                    break
+        
+        try:
+            loop = asyncio.get_running_loop()
+            log_stream = iter(container.logs(stream=True, follow=True))
+            # Chunks can split multi-byte characters
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
             
-            def read_logs():
-                try:
-                    for chunk in log_stream:
-                        if stop_event.is_set():
+            async def follow_logs():
+                buffer = ""
+                while True:
+                    # The SDK stream is blocking; read each chunk in the executor.
+                    # It ends (None) once the container stops.
+                    read = loop.run_in_executor(None, next, log_stream, None)
+                    while pending:
+                        # Write a held-back message once its interval is up,
+                        # even if the next log line is minutes away
+                        delay = last_saved_at + STATUS_UPDATE_INTERVAL - time.monotonic()
+                        done, _ = await asyncio.wait({read}, timeout=max(delay, 0))
+                        if done:
                             break
-                        log_queue.put(chunk.decode('utf-8'))
-                except Exception as e:
-                    logger.debug(f"Log stream ended: {e}")
-                finally:
-                    log_queue.put(None)  # Signal end
-            
-            log_thread = threading.Thread(target=read_logs, daemon=True)
-            log_thread.start()
-            
-            # Process logs with timeout
-            timeout_seconds = 1800  # 30 minutes total
-            start_time = datetime.utcnow()
-            
-            while True:
-                # Check timeout
-                elapsed = (datetime.utcnow() - start_time).total_seconds()
-                if elapsed > timeout_seconds:
-                    logger.error(f"Container timeout after {elapsed}s")
-                    container.kill()
-                    return -1
-                
-                # Check if container finished
-                container.reload()
-                if container.status in ('exited', 'dead'):
-                    break
-                
-                # Get logs from queue with small timeout
-                try:
-                    chunk = log_queue.get(timeout=2.0)
+                        await save(*pending)
+                    chunk = await read
                     if chunk is None:
-                        break
-                    buffer += chunk
+                        return
+                    buffer += decoder.decode(chunk)
                     
                     # Process buffer line by line
                     while '\n' in buffer:
                         line, buffer = buffer.split('\n', 1)
                         line = line.strip()
-                        if not line:
-                            continue
-                        
-                        # Check for progress markers
-                        for marker, (new_status, message) in status_markers.items():
-                            if marker in line:
-                                if new_status != current_status or message != last_message:
-                                    current_status = new_status
-                                    last_message = message
-                                    logger.info(f"[Job {job_id}] Status: {new_status.value} - {message}")
-                                    self._update_status(db, job_id, new_status, message=message)
-                                break
-                        
-                        # Check for errors
-                        if line.startswith("ERROR:"):
-                            logger.warning(f"[Job {job_id}] Container error: {line}")
-                            
-                except queue.Empty:
-                    # No new logs, check container status
+                        if line:
+                            tail.append(line)
+                            await handle_line(line)
+            
+            timeout_seconds = 1800  # 30 minutes total
+            try:
+                await asyncio.wait_for(follow_logs(), timeout=timeout_seconds)
+            except asyncio.TimeoutError:
+                logger.error(f"Container timeout after {timeout_seconds}s")
+                try:
+                    await loop.run_in_executor(None, container.kill)
+                except NotFound:
                     pass
-                
-                # Yield to event loop
-                await asyncio.sleep(0.1)
+                except APIError as e:
+                    logger.warning(f"Failed to kill timed out container: {e}")
+                return -1, "\n".join(tail)
             
-            stop_event.set()
+            # Write the last coalesced progress message
+            if pending:
+                await save(*pending)
             
             # Get final exit code
-            container.reload()
-            return container.attrs.get('State', {}).get('ExitCode', -1)
+            result = await loop.run_in_executor(None, container.wait)
+            return result.get('StatusCode', -1), "\n".join(tail)
             
         except Exception as e:
             logger.exception(f"Error monitoring container for job {job_id}")
-            return -1
+            return -1, "\n".join(tail)
     
     def _generate_ubuntu_script(self, kernel_version: str, codename: str) -> str:
         """Generate the shell script to run inside Ubuntu container."""
@@ -722,21 +938,23 @@ OUTPUT_DIR="$PWD"
 # Configure apt for non-interactive mode
 export DEBIAN_FRONTEND=noninteractive
 
-# Update package lists
-echo ">>> Updating package lists..."
-apt-get update -qq
-
-# Install required packages
-echo ">>> Installing required packages..."
-apt-get install -y -qq wget xz-utils ubuntu-dbgsym-keyring
+# Update package lists and install required packages (baked into symgen-tools images)
+if [ ! -x /usr/local/bin/dwarf2json ]; then
+    echo ">>> Updating package lists..."
+    apt-get update -qq
+    echo ">>> Installing required packages..."
+    apt-get install -y -qq wget xz-utils ubuntu-dbgsym-keyring
+fi
 
 # Add Ubuntu proposed repository for newer kernel packages
+# (kernel packages only live in main/restricted; skipping universe and
+# multiverse keeps the index download small)
 echo ">>> Adding proposed repository..."
 cat > /etc/apt/sources.list.d/proposed.sources << 'EOF'
 Types: deb
 URIs: http://archive.ubuntu.com/ubuntu/
 Suites: {codename}-proposed
-Components: main restricted universe multiverse
+Components: main restricted
 Signed-by: /usr/share/keyrings/ubuntu-archive-keyring.gpg
 EOF
 
@@ -746,7 +964,7 @@ cat > /etc/apt/sources.list.d/ddebs.sources << 'EOF'
 Types: deb
 URIs: http://ddebs.ubuntu.com/
 Suites: {codename} {codename}-updates {codename}-proposed
-Components: main restricted universe multiverse
+Components: main restricted
 Signed-by: /usr/share/keyrings/ubuntu-dbgsym-keyring.gpg
 EOF
 
@@ -780,10 +998,12 @@ if [ -z "$VMLINUX" ] || [ ! -f "$VMLINUX" ]; then
 fi
 echo ">>> Found vmlinux: $VMLINUX"
 
-# Download and setup dwarf2json
+# Download and setup dwarf2json (unless the image already has it)
 echo ">>> Setting up dwarf2json..."
-wget -q https://github.com/volatilityfoundation/dwarf2json/releases/download/v0.8.0/dwarf2json-linux-amd64 -O /usr/local/bin/dwarf2json
-chmod +x /usr/local/bin/dwarf2json
+if [ ! -x /usr/local/bin/dwarf2json ]; then
+    wget -q {DWARF2JSON_URL} -O /usr/local/bin/dwarf2json
+    chmod +x /usr/local/bin/dwarf2json
+fi
 
 # Check for System.map (installed with linux-modules package)
 SYSTEM_MAP=""
@@ -798,15 +1018,14 @@ fi
 echo ">>> Generating Volatility3 symbol file..."
 SYMBOL_FILE="$OUTPUT_DIR/Ubuntu_{codename}_{kernel_version}.json"
 
+# Compress while generating: the uncompressed JSON never touches the volume
+set -o pipefail
 if [ -n "$SYSTEM_MAP" ]; then
-    /usr/local/bin/dwarf2json linux --elf "$VMLINUX" --system-map "$SYSTEM_MAP" > "$SYMBOL_FILE"
+    /usr/local/bin/dwarf2json linux --elf "$VMLINUX" --system-map "$SYSTEM_MAP" | xz -9 -T{CONTAINER_CPUS} -c > "$SYMBOL_FILE.xz"
 else
-    /usr/local/bin/dwarf2json linux --elf "$VMLINUX" > "$SYMBOL_FILE"
+    /usr/local/bin/dwarf2json linux --elf "$VMLINUX" | xz -9 -T{CONTAINER_CPUS} -c > "$SYMBOL_FILE.xz"
 fi
-
-# Compress the symbol file
-echo ">>> Compressing symbol file..."
-xz -9 "$SYMBOL_FILE"
+set +o pipefail
 
 echo "=== Symbol generation completed successfully ==="
 ls -la "$OUTPUT_DIR"
@@ -825,13 +1044,13 @@ OUTPUT_DIR="$PWD"
 # Configure apt for non-interactive mode
 export DEBIAN_FRONTEND=noninteractive
 
-# Update package lists
-echo ">>> Updating package lists..."
-apt-get update -qq
-
-# Install required packages
-echo ">>> Installing required packages..."
-apt-get install -y -qq wget xz-utils ca-certificates
+# Update package lists and install required packages (baked into symgen-tools images)
+if [ ! -x /usr/local/bin/dwarf2json ]; then
+    echo ">>> Updating package lists..."
+    apt-get update -qq
+    echo ">>> Installing required packages..."
+    apt-get install -y -qq wget xz-utils ca-certificates
+fi
 
 # Add Debian debug repository
 echo ">>> Adding debug repository..."
@@ -874,10 +1093,12 @@ if [ -z "$VMLINUX" ] || [ ! -f "$VMLINUX" ]; then
 fi
 echo ">>> Found vmlinux: $VMLINUX"
 
-# Download and setup dwarf2json
+# Download and setup dwarf2json (unless the image already has it)
 echo ">>> Setting up dwarf2json..."
-wget -q https://github.com/volatilityfoundation/dwarf2json/releases/download/v0.8.0/dwarf2json-linux-amd64 -O /usr/local/bin/dwarf2json
-chmod +x /usr/local/bin/dwarf2json
+if [ ! -x /usr/local/bin/dwarf2json ]; then
+    wget -q {DWARF2JSON_URL} -O /usr/local/bin/dwarf2json
+    chmod +x /usr/local/bin/dwarf2json
+fi
 
 # Check for System.map (installed with linux-image package)
 SYSTEM_MAP=""
@@ -892,15 +1113,14 @@ fi
 echo ">>> Generating Volatility3 symbol file..."
 SYMBOL_FILE="$OUTPUT_DIR/Debian_{codename}_{kernel_version}.json"
 
+# Compress while generating: the uncompressed JSON never touches the volume
+set -o pipefail
 if [ -n "$SYSTEM_MAP" ]; then
-    /usr/local/bin/dwarf2json linux --elf "$VMLINUX" --system-map "$SYSTEM_MAP" > "$SYMBOL_FILE"
+    /usr/local/bin/dwarf2json linux --elf "$VMLINUX" --system-map "$SYSTEM_MAP" | xz -9 -T{CONTAINER_CPUS} -c > "$SYMBOL_FILE.xz"
 else
-    /usr/local/bin/dwarf2json linux --elf "$VMLINUX" > "$SYMBOL_FILE"
+    /usr/local/bin/dwarf2json linux --elf "$VMLINUX" | xz -9 -T{CONTAINER_CPUS} -c > "$SYMBOL_FILE.xz"
 fi
-
-# Compress the symbol file
-echo ">>> Compressing symbol file..."
-xz -9 "$SYMBOL_FILE"
+set +o pipefail
 
 echo "=== Symbol generation completed successfully ==="
 ls -la "$OUTPUT_DIR"
@@ -956,10 +1176,12 @@ if [ -z "$VMLINUX" ] || [ ! -f "$VMLINUX" ]; then
 fi
 echo ">>> Found vmlinux: $VMLINUX"
 
-# Download and setup dwarf2json
+# Download and setup dwarf2json (unless the image already has it)
 echo ">>> Setting up dwarf2json..."
-wget -q https://github.com/volatilityfoundation/dwarf2json/releases/download/v0.8.0/dwarf2json-linux-amd64 -O /usr/local/bin/dwarf2json
-chmod +x /usr/local/bin/dwarf2json
+if [ ! -x /usr/local/bin/dwarf2json ]; then
+    wget -q {DWARF2JSON_URL} -O /usr/local/bin/dwarf2json
+    chmod +x /usr/local/bin/dwarf2json
+fi
 
 # Check for System.map
 SYSTEM_MAP=""
@@ -974,15 +1196,14 @@ fi
 echo ">>> Generating Volatility3 symbol file..."
 SYMBOL_FILE="$OUTPUT_DIR/Fedora_{fedora_version}_{kernel_version}.json"
 
+# Compress while generating: the uncompressed JSON never touches the volume
+set -o pipefail
 if [ -n "$SYSTEM_MAP" ]; then
-    /usr/local/bin/dwarf2json linux --elf "$VMLINUX" --system-map "$SYSTEM_MAP" > "$SYMBOL_FILE"
+    /usr/local/bin/dwarf2json linux --elf "$VMLINUX" --system-map "$SYSTEM_MAP" | xz -9 -T{CONTAINER_CPUS} -c > "$SYMBOL_FILE.xz"
 else
-    /usr/local/bin/dwarf2json linux --elf "$VMLINUX" > "$SYMBOL_FILE"
+    /usr/local/bin/dwarf2json linux --elf "$VMLINUX" | xz -9 -T{CONTAINER_CPUS} -c > "$SYMBOL_FILE.xz"
 fi
-
-# Compress the symbol file
-echo ">>> Compressing symbol file..."
-xz -9 "$SYMBOL_FILE"
+set +o pipefail
 
 echo "=== Symbol generation completed successfully ==="
 ls -la "$OUTPUT_DIR"
@@ -1036,10 +1257,12 @@ if [ -z "$VMLINUX" ] || [ ! -f "$VMLINUX" ]; then
 fi
 echo ">>> Found vmlinux: $VMLINUX"
 
-# Download and setup dwarf2json
+# Download and setup dwarf2json (unless the image already has it)
 echo ">>> Setting up dwarf2json..."
-wget -q https://github.com/volatilityfoundation/dwarf2json/releases/download/v0.8.0/dwarf2json-linux-amd64 -O /usr/local/bin/dwarf2json
-chmod +x /usr/local/bin/dwarf2json
+if [ ! -x /usr/local/bin/dwarf2json ]; then
+    wget -q {DWARF2JSON_URL} -O /usr/local/bin/dwarf2json
+    chmod +x /usr/local/bin/dwarf2json
+fi
 
 # Check for System.map
 SYSTEM_MAP=""
@@ -1054,15 +1277,14 @@ fi
 echo ">>> Generating Volatility3 symbol file..."
 SYMBOL_FILE="$OUTPUT_DIR/{distro_name}_{rhel_version}_{kernel_version}.json"
 
+# Compress while generating: the uncompressed JSON never touches the volume
+set -o pipefail
 if [ -n "$SYSTEM_MAP" ]; then
-    /usr/local/bin/dwarf2json linux --elf "$VMLINUX" --system-map "$SYSTEM_MAP" > "$SYMBOL_FILE"
+    /usr/local/bin/dwarf2json linux --elf "$VMLINUX" --system-map "$SYSTEM_MAP" | xz -9 -T{CONTAINER_CPUS} -c > "$SYMBOL_FILE.xz"
 else
-    /usr/local/bin/dwarf2json linux --elf "$VMLINUX" > "$SYMBOL_FILE"
+    /usr/local/bin/dwarf2json linux --elf "$VMLINUX" | xz -9 -T{CONTAINER_CPUS} -c > "$SYMBOL_FILE.xz"
 fi
-
-# Compress the symbol file
-echo ">>> Compressing symbol file..."
-xz -9 "$SYMBOL_FILE"
+set +o pipefail
 
 echo "=== Symbol generation completed successfully ==="
 ls -la "$OUTPUT_DIR"
@@ -1137,10 +1359,12 @@ if [ -z "$VMLINUX" ] || [ ! -f "$VMLINUX" ]; then
 fi
 echo ">>> Found vmlinux: $VMLINUX"
 
-# Download and setup dwarf2json
+# Download and setup dwarf2json (unless the image already has it)
 echo ">>> Setting up dwarf2json..."
-wget -q https://github.com/volatilityfoundation/dwarf2json/releases/download/v0.8.0/dwarf2json-linux-amd64 -O /usr/local/bin/dwarf2json
-chmod +x /usr/local/bin/dwarf2json
+if [ ! -x /usr/local/bin/dwarf2json ]; then
+    wget -q {DWARF2JSON_URL} -O /usr/local/bin/dwarf2json
+    chmod +x /usr/local/bin/dwarf2json
+fi
 
 # Check for System.map
 SYSTEM_MAP=""
@@ -1155,15 +1379,14 @@ fi
 echo ">>> Generating Volatility3 symbol file..."
 SYMBOL_FILE="$OUTPUT_DIR/Oracle_{oracle_version}_{kernel_version}.json"
 
+# Compress while generating: the uncompressed JSON never touches the volume
+set -o pipefail
 if [ -n "$SYSTEM_MAP" ]; then
-    /usr/local/bin/dwarf2json linux --elf "$VMLINUX" --system-map "$SYSTEM_MAP" > "$SYMBOL_FILE"
+    /usr/local/bin/dwarf2json linux --elf "$VMLINUX" --system-map "$SYSTEM_MAP" | xz -9 -T{CONTAINER_CPUS} -c > "$SYMBOL_FILE.xz"
 else
-    /usr/local/bin/dwarf2json linux --elf "$VMLINUX" > "$SYMBOL_FILE"
+    /usr/local/bin/dwarf2json linux --elf "$VMLINUX" | xz -9 -T{CONTAINER_CPUS} -c > "$SYMBOL_FILE.xz"
 fi
-
-# Compress the symbol file
-echo ">>> Compressing symbol file..."
-xz -9 "$SYMBOL_FILE"
+set +o pipefail
 
 echo "=== Symbol generation completed successfully ==="
 ls -la "$OUTPUT_DIR"
@@ -1248,13 +1471,22 @@ ls -la "$OUTPUT_DIR"
         """
         ensure_directories()
         
-        db = SessionLocal()
+        # Keep the job loaded across commits; only this task writes it while running.
+        # Holding `job` here keeps it in the (weakly referenced) identity map.
+        db = SessionLocal(expire_on_commit=False)
         container = None
         
         try:
-            if not self.is_available():
-                self._update_status(db, job_id, SymGenStatus.FAILED,
-                                  error="Docker is not available")
+            job = await asyncio.to_thread(db.get, SymbolGeneration, job_id)
+            if not job or job.status not in IN_PROGRESS_STATUSES:
+                # Deleted or cancelled while it was waiting for a slot or worker
+                logger.info(f"Job {job_id} is no longer pending, skipping it")
+                return False
+            
+            # May reconnect to Docker, so it runs in a thread
+            if not await asyncio.to_thread(self.is_available):
+                await self._update_status(db, job_id, SymGenStatus.FAILED,
+                                        error="Docker is not available")
                 return False
             
             # Get image and script based on distro
@@ -1289,8 +1521,8 @@ ls -la "$OUTPUT_DIR"
                 script = self._generate_rhel_script(kernel_version, alma_version.value, "Alma")
             
             if not image or not script:
-                self._update_status(db, job_id, SymGenStatus.FAILED,
-                                  error="Invalid distro configuration")
+                await self._update_status(db, job_id, SymGenStatus.FAILED,
+                                        error="Invalid distro configuration")
                 return False
             
             symbol_filename = get_symbol_filename(
@@ -1307,58 +1539,55 @@ ls -la "$OUTPUT_DIR"
             )
             if existing:
                 logger.info(f"Symbol already exists: {existing}")
-                job = db.query(SymbolGeneration).filter(SymbolGeneration.id == job_id).first()
-                if job:
-                    job.status = SymGenStatus.COMPLETED
-                    job.status_message = "Symbol already exists"
-                    job.symbol_filename = symbol_filename
-                    job.symbol_file_path = existing
-                    job.symbol_file_size = os.path.getsize(existing)
-                    job.completed_at = datetime.utcnow()
-                    db.commit()
-                    self._broadcast_job_update(job)  # Broadcast COMPLETED status
-                return True
-            
-            # Pull image if needed
-            self._update_status(db, job_id, SymGenStatus.PULLING_IMAGE,
-                              message=f"Pulling {image}...")
+                file_size = await asyncio.to_thread(os.path.getsize, existing)
+                return await self._update_status(db, job_id, SymGenStatus.COMPLETED,
+                                               message="Symbol already exists",
+                                               symbol_filename=symbol_filename,
+                                               symbol_file_path=existing,
+                                               symbol_file_size=file_size)
             
-            try:
-                # Check if image exists (we'll always pull with platform to ensure correct arch)
-                self.docker_client.images.get(image)
-                logger.info(f"Image {image} found locally")
-            except ImageNotFound:
-                pass
+            # Pull image if needed; a False update means the job was cancelled
+            if not await self._update_status(db, job_id, SymGenStatus.PULLING_IMAGE,
+                                           message=f"Pulling {image}..."):
+                return False
             
-            # Always pull to ensure we have the amd64 version
-            logger.info(f"Pulling image {image} for linux/amd64 platform...")
-            self.docker_client.images.pull(image, platform="linux/amd64")
+            # Blocking Docker and file calls below run in a thread so the event
+            # loop keeps serving requests while images pull and files move
+            tools_image = TOOLS_IMAGE_PREFIX + image if distro in TOOLS_PACKAGES else None
+            if tools_image and await asyncio.to_thread(self._has_amd64_image, tools_image):
+                image = tools_image
+            else:
+                # A local amd64 image is used as-is; only pull when missing or another arch
+                if not await asyncio.to_thread(self._has_amd64_image, image):
+                    logger.info(f"Pulling image {image} for linux/amd64 platform...")
+                    await asyncio.to_thread(self.docker_client.images.pull, image, platform="linux/amd64")
+                if tools_image:
+                    await self._update_status(db, job_id, SymGenStatus.PULLING_IMAGE,
+                                            message=f"Preparing {tools_image} (first run only)...")
+                    image = await asyncio.to_thread(self._build_tools_image, image, tools_image, distro)
             
             # Create temp output directory inside the uploads volume
             temp_subdir = f"symbols/temp_{job_id}"
             output_dir = os.path.join(UPLOAD_DIR, temp_subdir)
             os.makedirs(output_dir, exist_ok=True)
             
-            # Script was already generated above based on distro
-            script_path = os.path.join(output_dir, "generate.sh")
-            with open(script_path, 'w') as f:
-                f.write(script)
-            os.chmod(script_path, 0o755)
-            
             # Start container
-            self._update_status(db, job_id, SymGenStatus.RUNNING,
-                              message="Starting container...")
+            if not await self._update_status(db, job_id, SymGenStatus.RUNNING,
+                                           message="Starting container..."):
+                return False
             
             logger.info(f"Starting container for job {job_id}")
             
             # Mount the Docker volume and use subdirectory for this job
             # The volume is mounted at /uploads in the symgen container
             # Our work directory will be /uploads/symbols/temp_{job_id}
+            # (the script generated above is passed inline, not written to the volume)
             work_dir_in_container = f"/uploads/{temp_subdir}"
             
-            container = self.docker_client.containers.run(
+            container = await asyncio.to_thread(
+                self.docker_client.containers.run,
                 image,
-                command=["bash", f"{work_dir_in_container}/generate.sh"],
+                command=["bash", "-c", script],
                 volumes={
                     DOCKER_VOLUME_NAME: {'bind': '/uploads', 'mode': 'rw'},
                 },
@@ -1368,115 +1597,126 @@ ls -la "$OUTPUT_DIR"
                 remove=False,
                 mem_limit='8g',
                 cpu_period=100000,
-                cpu_quota=200000,  # 2 CPUs max
+                cpu_quota=CONTAINER_CPUS * 100000,
             )
             
-            # Update container ID
-            job = db.query(SymbolGeneration).filter(SymbolGeneration.id == job_id).first()
-            if job:
-                job.container_id = container.id[:12]
-                db.commit()
-            
-            # Monitor container with real-time status updates
-            self._update_status(db, job_id, SymGenStatus.DOWNLOADING_KERNEL,
-                              message="Downloading kernel debug symbols...")
+            # Monitor container with real-time status updates (a job cancelled
+            # while the container started up has it removed below)
+            if not await self._update_status(db, job_id, SymGenStatus.DOWNLOADING_KERNEL,
+                                           message="Downloading kernel debug symbols...",
+                                           container_id=container.id[:12]):
+                return False
             
             # Stream logs and update status based on progress markers
-            exit_code = await self._monitor_container(db, job_id, container)
-            
-            # Get full logs for debugging
-            logs = container.logs().decode('utf-8')
-            logger.info(f"Container logs for job {job_id}:\n{logs}")
+            # (the streamed log tail is kept, so the logs aren't fetched again)
+            exit_code, logs = await self._monitor_container(db, job_id, container)
+            logger.info(f"Container logs for job {job_id} (last {LOG_TAIL_LINES} lines):\n{logs}")
             
+            # A cancelled job's killed container exits non-zero too; the update
+            # below then leaves its "Cancelled by user" state alone
             if exit_code != 0:
-                self._update_status(db, job_id, SymGenStatus.FAILED,
-                                  error=f"Container exited with code {exit_code}: {logs[-2000:]}")
+                await self._update_status(db, job_id, SymGenStatus.FAILED,
+                                        error=f"Container exited with code {exit_code}: {logs[-2000:]}")
                 return False
             
             # Find generated symbol file
-            self._update_status(db, job_id, SymGenStatus.GENERATING_SYMBOL,
-                              message="Processing symbol file...")
+            if not await self._update_status(db, job_id, SymGenStatus.GENERATING_SYMBOL,
+                                           message="Processing symbol file..."):
+                return False
             
-            symbol_files = glob_module.glob(os.path.join(output_dir, "*.json.xz"))
+            with os.scandir(output_dir) as entries:
+                symbol_files = [
+                    entry.path for entry in entries
+                    if entry.name.endswith(".json.xz") and not entry.name.startswith(".")
+                ]
             if not symbol_files:
-                self._update_status(db, job_id, SymGenStatus.FAILED,
-                                  error="No symbol file was generated")
+                await self._update_status(db, job_id, SymGenStatus.FAILED,
+                                        error="No symbol file was generated")
                 return False
             
             generated_file = symbol_files[0]
             final_path = os.path.join(SYMBOLS_DIR, symbol_filename)
             
             # Move to final location
-            shutil.move(generated_file, final_path)
+            await asyncio.to_thread(shutil.move, generated_file, final_path)
             
             # Update job as completed
-            file_size = os.path.getsize(final_path)
-            job = db.query(SymbolGeneration).filter(SymbolGeneration.id == job_id).first()
-            if job:
-                job.status = SymGenStatus.COMPLETED
-                job.status_message = "Symbol generated successfully"
-                job.symbol_filename = symbol_filename
-                job.symbol_file_path = final_path
-                job.symbol_file_size = file_size
-                job.completed_at = datetime.utcnow()
-                db.commit()
-                self._broadcast_job_update(job)  # Broadcast COMPLETED status
+            file_size = await asyncio.to_thread(os.path.getsize, final_path)
+            if not await self._update_status(db, job_id, SymGenStatus.COMPLETED,
+                                           message="Symbol generated successfully",
+                                           symbol_filename=symbol_filename,
+                                           symbol_file_path=final_path,
+                                           symbol_file_size=file_size):
+                return False
             
             logger.info(f"Symbol generation completed: {symbol_filename}")
             return True
             
         except Exception as e:
             logger.exception(f"Symbol generation failed for job {job_id}")
-            self._update_status(db, job_id, SymGenStatus.FAILED, error=str(e))
+            await asyncio.to_thread(db.rollback)
+            await self._update_status(db, job_id, SymGenStatus.FAILED, error=str(e))
             return False
             
         finally:
             # Cleanup
             if container:
                 try:
-                    container.remove(force=True)
+                    await asyncio.to_thread(container.remove, force=True)
                 except Exception:
                     pass
             
-            # Cleanup temp directory
+            # Cleanup temp directory (ignore_errors also covers it never being created)
             temp_dir = os.path.join(SYMBOLS_DIR, f"temp_{job_id}")
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir, ignore_errors=True)
+            await asyncio.to_thread(shutil.rmtree, temp_dir, ignore_errors=True)
             
-            db.close()
+            await asyncio.to_thread(db.close)
     
     async def cancel_job_async(self, job_id: int) -> bool:
-        """Cancel a job (async version for queue cancellation)."""
-        # Try to cancel from queue first
-        await job_queue.cancel_job(job_id)
-        return self.cancel_job(job_id)
+        """Cancel a job: drop it from its queue, then mark it and stop its container."""
+        if celery_enabled():
+            # Workers discard the revoked task if it hasn't been picked up yet
+            await asyncio.to_thread(revoke_generation, job_id)
+        else:
+            # The queue is only touched from the event loop; the rest blocks
+            await job_queue.cancel_job(job_id)
+        return await asyncio.to_thread(self.cancel_job, job_id)
+    
+    def _stop_container(self, container_id: str):
+        """Kill and remove a job's container (one API call, bounded by CONTAINER_STOP_TIMEOUT)."""
+        if not self.is_available():
+            return
+        try:
+            # remove(force=True) kills a running container itself, so no
+            # separate get()/kill() round-trips are needed
+            _stop_pool.submit(
+                self.docker_client.api.remove_container, container_id, force=True
+            ).result(timeout=CONTAINER_STOP_TIMEOUT)
+        except NotFound:
+            pass
+        except FuturesTimeoutError:
+            logger.warning(f"Stopping container {container_id} timed out after {CONTAINER_STOP_TIMEOUT}s")
+        except Exception as e:
+            logger.warning(f"Failed to stop container: {e}")
     
     def cancel_job(self, job_id: int) -> bool:
-        """Cancel a running symbol generation job."""
+        """Mark a job cancelled and stop its container (blocking; see cancel_job_async)."""
         db = SessionLocal()
         try:
             job = db.query(SymbolGeneration).filter(SymbolGeneration.id == job_id).first()
             if not job:
                 return False
             
-            # Try to cancel from queue (sync version - checks if queued)
-            queue_pos = job_queue.get_queue_position(job_id)
-            if queue_pos:
-                # Job is queued, will be removed by async cancel
-                logger.info(f"Job {job_id} is queued at position {queue_pos}, marking as cancelled")
-            
-            if job.container_id and self.is_available():
-                try:
-                    container = self.docker_client.containers.get(job.container_id)
-                    container.kill()
-                    container.remove(force=True)
-                except Exception as e:
-                    logger.warning(f"Failed to stop container: {e}")
-            
+            # Marked first, so the generator sees the cancellation once its
+            # container exits and doesn't record the exit as a failure
             job.status = SymGenStatus.FAILED
             job.error_message = "Cancelled by user"
             job.completed_at = datetime.utcnow()
             db.commit()
+            invalidate_cache()
+            
+            if job.container_id:
+                self._stop_container(job.container_id)
             return True
             
         finally:
@@ -1484,53 +1724,63 @@ ls -la "$OUTPUT_DIR"
     
     def delete_job(self, job_id: int) -> bool:
         """Delete a symbol generation job and its associated files."""
+        return bool(self.delete_jobs([job_id]))
+    
+    def delete_jobs(self, job_ids: List[int]) -> List[int]:
+        """Delete several jobs and their files; returns the IDs that were deleted."""
         db = SessionLocal()
         try:
-            job = db.query(SymbolGeneration).filter(SymbolGeneration.id == job_id).first()
-            if not job:
-                return False
-            
-            # If job is still running, cancel it first
-            if job.status in (SymGenStatus.PENDING, SymGenStatus.PULLING_IMAGE,
-                            SymGenStatus.RUNNING, SymGenStatus.DOWNLOADING_KERNEL,
-                            SymGenStatus.GENERATING_SYMBOL):
-                if job.container_id and self.is_available():
-                    try:
-                        container = self.docker_client.containers.get(job.container_id)
-                        container.kill()
-                        container.remove(force=True)
-                    except Exception as e:
-                        logger.warning(f"Failed to stop container: {e}")
-            
-            # Delete symbol file if it exists
-            if job.symbol_file_path and os.path.exists(job.symbol_file_path):
-                try:
-                    os.remove(job.symbol_file_path)
-                    logger.info(f"Deleted symbol file: {job.symbol_file_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to delete symbol file: {e}")
-            
-            # Clean up temp directory if it exists
-            temp_dir = os.path.join(SYMBOLS_DIR, f"temp_{job_id}")
-            if os.path.exists(temp_dir):
-                try:
-                    shutil.rmtree(temp_dir, ignore_errors=True)
-                    logger.info(f"Deleted temp directory: {temp_dir}")
-                except Exception as e:
-                    logger.warning(f"Failed to delete temp directory: {e}")
-            
-            # Delete the database record
-            db.delete(job)
+            # Delete the records and fetch what needs cleaning up in one statement
+            rows = db.execute(
+                delete(SymbolGeneration)
+                .where(SymbolGeneration.id.in_(job_ids))
+                .returning(
+                    SymbolGeneration.id,
+                    SymbolGeneration.status,
+                    SymbolGeneration.container_id,
+                    SymbolGeneration.symbol_file_path,
+                )
+            ).all()
             db.commit()
-            logger.info(f"Deleted symbol generation job {job_id}")
-            return True
-            
         except Exception as e:
-            logger.error(f"Failed to delete job {job_id}: {e}")
+            logger.error(f"Failed to delete jobs {job_ids}: {e}")
             db.rollback()
-            return False
+            return []
         finally:
             db.close()
+        
+        # Cleanup is Docker and filesystem I/O, independent between jobs
+        if len(rows) == 1:
+            self._cleanup_deleted_job(*rows[0])
+        else:
+            list(_cleanup_pool.map(lambda row: self._cleanup_deleted_job(*row), rows))
+        
+        if rows:
+            invalidate_cache()
+        return [row.id for row in rows]
+    
+    def _cleanup_deleted_job(self, job_id: int, job_status: SymGenStatus,
+                             container_id: Optional[str], symbol_file_path: Optional[str]):
+        """Stop the container and remove the files of a deleted job."""
+        # Only a job that may still be running has a container or temp directory;
+        # finished jobs had both cleaned up when generation ended
+        if job_status in IN_PROGRESS_STATUSES:
+            if container_id:
+                self._stop_container(container_id)
+            temp_dir = os.path.join(SYMBOLS_DIR, f"temp_{job_id}")
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        
+        # Delete symbol file if it exists (unlink directly rather than stat first)
+        if symbol_file_path:
+            try:
+                os.remove(symbol_file_path)
+                logger.info(f"Deleted symbol file: {symbol_file_path}")
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Failed to delete symbol file: {e}")
+        
+        logger.info(f"Deleted symbol generation job {job_id}")
 
 
 # Global instance
@@ -2,17 +2,61 @@
 WebSocket Connection Manager
 
 Handles WebSocket connections and broadcasts for real-time updates.
+
+When Redis is configured, broadcasts are published to a `ws:<channel>`
+pub/sub channel and every API process relays them to its own connected
+sockets, so updates reach all clients regardless of which uvicorn worker,
+pod or Celery worker produced them.
 """
 
-import json
 import logging
 import threading
 import asyncio
-from typing import Dict, Set
+from typing import Dict, Optional, Set
+
+import orjson
 from fastapi import WebSocket
 
+from app.models import SymbolGeneration, SymGenStatus, LinuxDistro, DISTRO_VERSION_FIELDS
+from app.redis_client import get_async_redis, get_sync_redis
+
 logger = logging.getLogger(__name__)
 
+# Prefix of the Redis pub/sub channels carrying WebSocket broadcasts
+REDIS_CHANNEL_PREFIX = "ws:"
+
+# Enum -> wire string lookups, built once
+_STATUS_STR = {s: s.value for s in SymGenStatus}
+_DISTRO_STR = {d: d.value for d in LinuxDistro}
+_DISTRO_VERSION_FIELD = {d: field for d, (field, _) in DISTRO_VERSION_FIELDS.items()}
+_NO_VERSIONS = {field: None for field, _ in DISTRO_VERSION_FIELDS.values()}
+
+
+def serialize_job(job: SymbolGeneration) -> dict:
+    """Build the JSON-ready job dict sent in job_update messages."""
+    started_at = job.started_at
+    completed_at = job.completed_at
+    created_at = job.created_at
+    data = {
+        "id": job.id,
+        "kernel_version": job.kernel_version,
+        "distro": _DISTRO_STR.get(job.distro),
+        **_NO_VERSIONS,
+        "status": _STATUS_STR.get(job.status),
+        "status_message": job.status_message,
+        "error_message": job.error_message,
+        "symbol_filename": job.symbol_filename,
+        "symbol_file_size": job.symbol_file_size,
+        "download_count": job.download_count,
+        "started_at": started_at.isoformat() if started_at else None,
+        "completed_at": completed_at.isoformat() if completed_at else None,
+        "created_at": created_at.isoformat() if created_at else None,
+    }
+    version_field = _DISTRO_VERSION_FIELD.get(job.distro)
+    if version_field:
+        data[version_field] = job.distro_version
+    return data
+
 
 class ConnectionManager:
     """Manages WebSocket connections for real-time updates."""
@@ -21,6 +65,7 @@ class ConnectionManager:
         # Maps channel names to sets of connected websockets
         self.active_connections: Dict[str, Set[WebSocket]] = {}
         self._lock = threading.Lock()
+        self._subscriber_task: Optional[asyncio.Task] = None
     
     async def connect(self, websocket: WebSocket, channel: str = "default"):
         """Accept a new WebSocket connection and add to channel."""
@@ -42,6 +87,21 @@ class ConnectionManager:
     
     async def broadcast(self, message: dict, channel: str = "default"):
         """Broadcast a message to all connections in a channel (async only)."""
+        payload = orjson.dumps(message)
+        logger.info(f"[WS] Broadcasting to '{channel}': {message.get('type', 'unknown')}")
+        
+        redis = get_async_redis()
+        if redis is not None:
+            try:
+                await redis.publish(REDIS_CHANNEL_PREFIX + channel, payload)
+                return
+            except Exception as e:
+                logger.warning(f"[WS] Redis publish failed, sending locally: {e}")
+        
+        await self._send_local(channel, payload.decode("utf-8"))
+    
+    async def _send_local(self, channel: str, message_json: str):
+        """Send an already serialized message to this process's connections."""
         with self._lock:
             connections = self.active_connections.get(channel, set()).copy()
         
@@ -49,9 +109,6 @@ class ConnectionManager:
             return
         
         disconnected = set()
-        message_json = json.dumps(message)
-        logger.info(f"[WS] Broadcasting to '{channel}': {message.get('type', 'unknown')}")
-        
         for websocket in connections:
             try:
                 await websocket.send_text(message_json)
@@ -69,6 +126,16 @@ class ConnectionManager:
         Broadcast a message from a synchronous context (e.g., background tasks).
         Creates a new event loop if needed.
         """
+        redis = get_sync_redis()
+        if redis is not None:
+            # Blocking publish works from any thread or process, loop or not
+            try:
+                redis.publish(REDIS_CHANNEL_PREFIX + channel, orjson.dumps(message))
+                logger.info(f"[WS] Published (sync) to '{channel}': {message.get('type', 'unknown')}")
+                return
+            except Exception as e:
+                logger.warning(f"[WS] Redis publish failed, sending locally: {e}")
+        
         with self._lock:
             connections = self.active_connections.get(channel, set()).copy()
         
@@ -76,7 +143,7 @@ class ConnectionManager:
             logger.debug(f"[WS] No connections in '{channel}' to broadcast to")
             return
         
-        message_json = json.dumps(message)
+        message_json = orjson.dumps(message).decode("utf-8")
         logger.info(f"[WS] Broadcasting (sync) to '{channel}': {message.get('type', 'unknown')}")
         
         disconnected = set()
@@ -121,6 +188,47 @@ class ConnectionManager:
         """Get the number of connections in a channel."""
         with self._lock:
             return len(self.active_connections.get(channel, set()))
+    
+    async def start_backplane(self):
+        """Start relaying Redis broadcasts to local connections (no-op without Redis)."""
+        if get_async_redis() is None or self._subscriber_task is not None:
+            return
+        self._subscriber_task = asyncio.create_task(self._relay_from_redis())
+        logger.info("[WS] Redis backplane started")
+    
+    async def stop_backplane(self):
+        """Stop the Redis relay task."""
+        if self._subscriber_task is None:
+            return
+        self._subscriber_task.cancel()
+        try:
+            await self._subscriber_task
+        except asyncio.CancelledError:
+            pass
+        self._subscriber_task = None
+    
+    async def _relay_from_redis(self):
+        """Subscribe to all ws:* channels and fan messages out locally, reconnecting on errors."""
+        prefix_len = len(REDIS_CHANNEL_PREFIX)
+        while True:
+            pubsub = get_async_redis().pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.psubscribe(REDIS_CHANNEL_PREFIX + "*")
+                async for item in pubsub.listen():
+                    if item["type"] != "pmessage":
+                        continue
+                    channel = item["channel"].decode("utf-8")[prefix_len:]
+                    await self._send_local(channel, item["data"].decode("utf-8"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[WS] Redis subscription lost, retrying: {e}")
+                await asyncio.sleep(1.0)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
 
 
 # Global connection manager instance
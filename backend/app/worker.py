@@ -0,0 +1,113 @@
+"""
+Celery Worker
+
+Optional out-of-process execution of symbol generation jobs. When
+CELERY_BROKER_URL is set, the API enqueues jobs on the "symgen" queue and
+dedicated workers run them, so long Docker builds survive API restarts and
+can be spread over several hosts:
+
+    celery -A app.worker worker -Q symgen --concurrency=2
+
+Without a broker, jobs keep running in-process through the JobQueue.
+"""
+
+import os
+import asyncio
+import logging
+
+from celery import Celery
+from celery.signals import worker_ready
+
+from app.models import (
+    LinuxDistro,
+    UbuntuVersion, DebianVersion, FedoraVersion, CentOSVersion,
+    RHELVersion, OracleVersion, RockyVersion, AlmaVersion
+)
+
+logger = logging.getLogger(__name__)
+
+CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL")
+CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", CELERY_BROKER_URL)
+SYMGEN_QUEUE = "symgen"
+
+# Version enum for each per-distro version argument, in generate_symbol order
+VERSION_ENUMS = {
+    "ubuntu_version": UbuntuVersion,
+    "debian_version": DebianVersion,
+    "fedora_version": FedoraVersion,
+    "centos_version": CentOSVersion,
+    "rhel_version": RHELVersion,
+    "oracle_version": OracleVersion,
+    "rocky_version": RockyVersion,
+    "alma_version": AlmaVersion,
+}
+
+celery_app = Celery("symgen", broker=CELERY_BROKER_URL, backend=CELERY_RESULT_BACKEND)
+celery_app.conf.update(
+    task_default_queue=SYMGEN_QUEUE,
+    task_serializer="json",
+    accept_content=["json"],
+    # A job is only acknowledged once it finished, so a worker crash re-delivers it
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    # Generation jobs are long; don't let one worker hoard queued jobs
+    worker_prefetch_multiplier=1,
+)
+
+
+def celery_enabled() -> bool:
+    """Whether jobs should be dispatched to Celery workers."""
+    return bool(CELERY_BROKER_URL)
+
+
+@worker_ready.connect
+def preload_images(**kwargs):
+    """Warm the build images once the worker is up (see SYMGEN_PRELOAD_IMAGES)."""
+    from app.services.symgen import symbol_generator
+    symbol_generator.start_preload()
+
+
+@celery_app.task(bind=True, name="symgen.generate_symbol", acks_late=True)
+def generate_symbol_task(self, job_id: int, kernel_version: str, distro: str, versions: dict):
+    """Run a symbol generation job inside a Celery worker."""
+    # Imported here so the API process doesn't need a Docker client to enqueue
+    from app.services.symgen import symbol_generator
+
+    version_args = [
+        enum_cls(versions[field]) if versions.get(field) else None
+        for field, enum_cls in VERSION_ENUMS.items()
+    ]
+    logger.info(f"[Worker] Running job {job_id} ({self.request.id})")
+    return asyncio.run(
+        symbol_generator._execute_generation(
+            job_id, kernel_version, LinuxDistro(distro), *version_args
+        )
+    )
+
+
+def generation_task_id(job_id: int) -> str:
+    """Celery task ID of a job's generation task, so cancelling can revoke it by job ID."""
+    return f"symgen-job-{job_id}"
+
+
+def enqueue_generation(
+    job_id: int,
+    kernel_version: str,
+    distro: LinuxDistro,
+    **versions,
+):
+    """Send a job to the Celery queue with JSON-serializable arguments."""
+    payload = {
+        field: versions[field].value if versions.get(field) else None
+        for field in VERSION_ENUMS
+    }
+    return generate_symbol_task.apply_async(
+        args=(job_id, kernel_version, distro.value, payload),
+        queue=SYMGEN_QUEUE,
+        task_id=generation_task_id(job_id),
+    )
+
+
+def revoke_generation(job_id: int):
+    """Revoke a job's generation task; workers drop it instead of running it."""
+    celery_app.control.revoke(generation_task_id(job_id))
@@ -0,0 +1,40 @@
+"""
+Shared test setup.
+
+The app reads its configuration at import time, so the environment is
+pointed at a throwaway SQLite database and upload directory first.
+"""
+
+import os
+import tempfile
+
+_tmp = tempfile.mkdtemp(prefix="symgen-test-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_tmp, 'symgen.db')}")
+os.environ.setdefault("UPLOAD_DIR", os.path.join(_tmp, "uploads"))
+os.environ.pop("REDIS_URL", None)
+os.environ.pop("CELERY_BROKER_URL", None)
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import Base, SessionLocal, engine
+from app.main import app
+
+
+@pytest.fixture
+def db():
+    """Fresh schema for each test, with a sync session on it."""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(db):
+    """API client on the test database."""
+    with TestClient(app) as test_client:
+        yield test_client
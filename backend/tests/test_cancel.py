@@ -0,0 +1,62 @@
+import asyncio
+from collections import deque
+
+import pytest
+
+from app.database import SessionLocal
+from app.models import LinuxDistro, SymbolGeneration, SymGenStatus
+from app.services.symgen import job_queue, symbol_generator
+
+
+def test_cancel_removes_queued_job(client, db, monkeypatch):
+    job = SymbolGeneration(
+        kernel_version="5.15.0-91-generic", distro=LinuxDistro.UBUNTU, status=SymGenStatus.PENDING
+    )
+    db.add(job)
+    db.commit()
+    monkeypatch.setattr(job_queue, "_pending_queue", deque([(job.id, (), {})]))
+    
+    response = client.post(f"/api/symgen/jobs/{job.id}/cancel")
+    
+    assert response.json()["success"] is True
+    assert job_queue.queued_count == 0
+    db.refresh(job)
+    assert job.status == SymGenStatus.FAILED
+    assert job.error_message == "Cancelled by user"
+
+
+def test_generation_skips_cancelled_job(db, monkeypatch):
+    job = SymbolGeneration(
+        kernel_version="5.15.0-91-generic", distro=LinuxDistro.UBUNTU,
+        status=SymGenStatus.FAILED, error_message="Cancelled by user",
+    )
+    db.add(job)
+    db.commit()
+    # A worker picking the job up late must not touch Docker at all
+    monkeypatch.setattr(symbol_generator, "is_available", lambda: pytest.fail("job was run"))
+    
+    assert asyncio.run(
+        symbol_generator._execute_generation(job.id, job.kernel_version, job.distro)
+    ) is False
+
+
+def test_container_exit_keeps_cancelled_state(db):
+    job = SymbolGeneration(
+        kernel_version="5.15.0-91-generic", distro=LinuxDistro.UBUNTU,
+        status=SymGenStatus.DOWNLOADING_KERNEL,
+    )
+    db.add(job)
+    db.commit()
+    generator_db = SessionLocal(expire_on_commit=False)
+    generator_db.get(SymbolGeneration, job.id)
+    
+    assert symbol_generator.cancel_job(job.id) is True
+    updated = asyncio.run(symbol_generator._update_status(
+        generator_db, job.id, SymGenStatus.FAILED, error="Container exited with code 137: "
+    ))
+    generator_db.close()
+    
+    assert updated is False
+    db.refresh(job)
+    assert job.status == SymGenStatus.FAILED
+    assert job.error_message == "Cancelled by user"
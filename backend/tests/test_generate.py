@@ -0,0 +1,22 @@
+from app.models import SymGenStatus
+from app.routers import symgen as symgen_router
+from app.services.symgen import symbol_generator
+
+
+def test_generate_enqueues_without_local_docker(client, db, monkeypatch):
+    monkeypatch.setattr(symgen_router, "celery_enabled", lambda: True)
+    monkeypatch.setattr(symbol_generator, "is_available", lambda: False)
+    enqueued = []
+    monkeypatch.setattr(
+        symgen_router, "enqueue_generation",
+        lambda job_id, *args, **kwargs: enqueued.append(job_id),
+    )
+    
+    response = client.post("/api/symgen/generate", json={
+        "kernel_version": "5.15.0-91-generic", "distro": "ubuntu", "ubuntu_version": "22.04",
+    })
+    
+    assert response.status_code == 200
+    job = response.json()
+    assert job["status"] == SymGenStatus.PENDING.value
+    assert enqueued == [job["id"]]
@@ -0,0 +1,51 @@
+import asyncio
+import time
+
+from app.models import SymGenStatus
+from app.services import symgen
+from app.services.symgen import symbol_generator
+
+
+class FakeContainer:
+    """Container whose log stream yields (delay, chunk) pairs in real time."""
+    
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.closed_at = None
+    
+    def logs(self, stream, follow):
+        for delay, chunk in self.chunks:
+            time.sleep(delay)
+            yield chunk
+        self.closed_at = time.monotonic()
+    
+    def wait(self):
+        return {"StatusCode": 0}
+
+
+def test_held_back_message_is_saved_during_long_step(monkeypatch):
+    monkeypatch.setattr(symgen, "STATUS_UPDATE_INTERVAL", 0.2)
+    saves = []
+    
+    async def update_status(db, job_id, status, message=None, **kwargs):
+        saves.append((time.monotonic(), status, message))
+        return True
+    
+    monkeypatch.setattr(symbol_generator, "_update_status", update_status)
+    container = FakeContainer([
+        (0.0, b">>> Looking for vmlinux...\n"),
+        # Arrives within the interval, so it is held back at first
+        (0.05, b">>> Generating Volatility3 symbol file...\n"),
+        # dwarf2json runs for a while without printing a marker
+        (1.0, b"done\n"),
+    ])
+    
+    exit_code, _ = asyncio.run(symbol_generator._monitor_container(None, 1, container))
+    
+    assert exit_code == 0
+    assert [(status, message) for _, status, message in saves] == [
+        (SymGenStatus.GENERATING_SYMBOL, "Locating kernel debug information..."),
+        (SymGenStatus.GENERATING_SYMBOL, "Generating symbol file (this may take a while)..."),
+    ]
+    # Written once the interval passed, not when the stream finally closed
+    assert saves[-1][0] < container.closed_at - 0.5
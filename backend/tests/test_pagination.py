@@ -0,0 +1,32 @@
+from app.models import LinuxDistro, SymbolGeneration, SymGenStatus
+
+
+def _add_jobs(db, count):
+    """Insert `count` jobs with server-default created_at values."""
+    for i in range(count):
+        db.add(SymbolGeneration(
+            kernel_version=f"5.15.0-{i}-generic",
+            distro=LinuxDistro.UBUNTU,
+            status=SymGenStatus.PENDING,
+        ))
+    db.commit()
+
+
+def test_jobs_cursor_pages_do_not_overlap(client, db):
+    _add_jobs(db, 6)
+    
+    pages = []
+    params = {"page_size": 2}
+    for _ in range(5):
+        body = client.get("/api/symgen/jobs", params=params).json()
+        pages.append([job["id"] for job in body["items"]])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+        params = {
+            "page_size": 2,
+            "cursor_created_at": cursor["created_at"],
+            "cursor_id": cursor["id"],
+        }
+    
+    assert pages == [[6, 5], [4, 3], [2, 1]]
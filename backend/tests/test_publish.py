@@ -0,0 +1,30 @@
+import asyncio
+import threading
+
+from app.models import LinuxDistro, SymbolGeneration, SymGenStatus
+from app.services import symgen
+from app.services.symgen import symbol_generator
+
+
+def test_job_updates_publish_off_the_event_loop_in_order(monkeypatch):
+    calls = []
+    monkeypatch.setattr(symgen, "redis_enabled", lambda: True)
+    monkeypatch.setattr(symgen, "invalidate_cache", lambda: None)
+    monkeypatch.setattr(
+        symgen.ws_manager, "broadcast_sync",
+        lambda message, channel: calls.append(
+            (threading.current_thread().name, message["job"]["status"])
+        ),
+    )
+    job = SymbolGeneration(id=1, kernel_version="5.15.0-91-generic", distro=LinuxDistro.UBUNTU)
+    
+    async def update_statuses():
+        for status in (SymGenStatus.RUNNING, SymGenStatus.GENERATING_SYMBOL, SymGenStatus.COMPLETED):
+            job.status = status
+            symbol_generator._broadcast_job_update(job)
+    
+    asyncio.run(update_statuses())
+    symgen._publish_pool.submit(lambda: None).result()
+    
+    assert [status for _, status in calls] == ["running", "generating_symbol", "completed"]
+    assert all(name.startswith("symgen-publish") for name, _ in calls)
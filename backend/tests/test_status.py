@@ -0,0 +1,18 @@
+from app.models import LinuxDistro, SymbolGeneration, SymGenStatus
+from app.routers import symgen as symgen_router
+
+
+def test_status_counts_worker_jobs_from_database(client, db, monkeypatch):
+    monkeypatch.setattr(symgen_router, "celery_enabled", lambda: True)
+    for status in (
+        SymGenStatus.PENDING, SymGenStatus.PENDING,
+        SymGenStatus.GENERATING_SYMBOL, SymGenStatus.COMPLETED,
+    ):
+        db.add(SymbolGeneration(
+            kernel_version="5.15.0-91-generic", distro=LinuxDistro.UBUNTU, status=status
+        ))
+    db.commit()
+    
+    queue = client.get("/api/symgen/status").json()["queue"]
+    
+    assert queue == {"running": 1, "queued": 2, "max_concurrent": 2}
@@ -282,8 +282,8 @@ export default function SymGenPage() {
         });
       }
       
-      setJobsTotalPages(response.total_pages);
-      setJobsTotal(response.total);
+      setJobsTotalPages(response.total_pages ?? 1);
+      setJobsTotal(response.total ?? 0);
     } catch (err) {
       console.error("Failed to fetch jobs:", err);
     }
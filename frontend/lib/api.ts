@@ -46,12 +46,18 @@ export interface SymGenJob {
   created_at: string;
 }
 
+export interface PageCursor {
+  created_at: string;
+  id: number;
+}
+
 export interface SymGenListResponse {
   items: SymGenJob[];
-  total: number;
+  total?: number | null;
   page: number;
   page_size: number;
-  total_pages: number;
+  total_pages?: number | null;
+  next_cursor?: PageCursor | null;
 }
 
 export interface GeneratedSymbol {
@@ -74,10 +80,11 @@ export interface GeneratedSymbol {
 
 export interface SymbolPortalResponse {
   items: GeneratedSymbol[];
-  total: number;
+  total?: number | null;
   page: number;
   page_size: number;
-  total_pages: number;
+  total_pages?: number | null;
+  next_cursor?: PageCursor | null;
 }
 
 export interface KernelParseResponse {
@@ -268,6 +275,15 @@ export const symgenApi = {
     return response.data;
   },
 
+  // Delete several jobs and their files; `deleted` lists the IDs that existed
+  deleteJobs: async (jobIds: number[]): Promise<{ success: boolean; deleted: number[]; message: string }> => {
+    const response = await api.post<{ success: boolean; deleted: number[]; message: string }>(
+      "/api/symgen/jobs/delete",
+      { job_ids: jobIds }
+    );
+    return response.data;
+  },
+
   // Symbol Portal - List available symbols (public)
   listSymbols: async (
     page: number = 1,